@@ -1,7 +1,90 @@
-import json
+import asyncio
+import hashlib
+import io
 import os
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
-import requests
+import httpx
+import orjson
+
+
+# ---------- Shared HTTP client ----------
+#
+# All send_* helpers POST to the same GraphQL host, so we keep one
+# module-level httpx client with keep-alive pooling instead of opening a
+# new TCP/TLS connection per mutation. HTTP/2 (negotiated when the server
+# supports it) multiplexes concurrent requests on a single connection;
+# against an HTTP/1.1 server the pool still covers the thread-pool width.
+
+# Same knob main.py uses for its send pools; reading it here keeps the
+# connection pool as wide as the thread pools that share it, so raising
+# the concurrency doesn't serialize on 8 pooled connections.
+MAX_WORKERS = int(os.environ.get("HERTTA_SEND_CONCURRENCY", "8"))
+
+# Pretty-print full server responses only when explicitly asked for;
+# re-serializing every response just to log it is pure overhead on the
+# hot send loops (and stdout serializes the thread pool).
+DEBUG = os.getenv("GRAPHQL_DEBUG") == "1"
+
+# Retry transient connect failures (requests did this via urllib3's
+# Retry on the mounted adapter); httpx only retries at the transport
+# level and never replays a request that already went out.
+_RETRIES = 3
+
+# http2/limits move onto the transport: passing an explicit transport
+# makes the client-level arguments inert.
+_CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        retries=_RETRIES,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=MAX_WORKERS,
+            max_keepalive_connections=MAX_WORKERS,
+        ),
+    ),
+    timeout=30,
+    headers={"Content-Type": "application/json"},
+)
+
+
+def close_session() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    _CLIENT.close()
+
+
+def _dumps(payload: Any, pretty: bool = False) -> bytes:
+    """Serialize a payload to UTF-8 JSON bytes via orjson."""
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+
+class _SafeTable(dict):
+    """
+    Lazily-built str.translate table: alphanumerics (any script, like
+    the baseline str.isalnum check) and "_- " map to themselves,
+    everything else to None (deleted). Filled on demand so we never
+    materialize the full Unicode range.
+    """
+
+    def __missing__(self, cp: int):
+        ch = chr(cp)
+        result = cp if (ch.isalnum() or ch in "_- ") else None
+        self[cp] = result
+        return result
+
+
+_SAFE_TABLE = _SafeTable()
+
+
+def _safe_name(name: str, default: str) -> str:
+    """Sanitize an entity name into a filename-safe token."""
+    return (name.translate(_SAFE_TABLE).strip() or default).replace(" ", "_")
+
+
+def _payload_key(payload: Any) -> bytes:
+    """Short content hash used to coalesce identical payloads."""
+    data = payload if isinstance(payload, bytes) else _dumps(payload)
+    return hashlib.blake2b(data, digest_size=16).digest()
 
 
 def build_graphql_payload(mutation: str, variables: Dict[str, Any]) -> Dict[str, Any]:
@@ -33,20 +116,81 @@ def send_graphql_payload(
 
     Returns the parsed JSON response as a dict.
     """
-    if headers is None:
-        headers = {}
+    # Serialize with orjson and send raw bytes (Content-Type is set on
+    # the client).
+    resp = _CLIENT.post(url, content=_dumps(payload), headers=headers, timeout=timeout)
+    print(f"→ POST {url} -> {resp.status_code}")
 
-    headers = {
-        "Content-Type": "application/json",
-        **headers,
-    }
+    try:
+        data = resp.json()
+        if DEBUG:
+            print(_dumps(data, pretty=True).decode())
+        else:
+            print(f"ok={not data.get('errors')}")
+        return data
+    except Exception:
+        print("Non-JSON response from server:")
+        print(resp.text)
+        return {"raw": resp.text, "status_code": resp.status_code}
+
+
+def send_parallel(
+    url: str,
+    payloads: List[Dict[str, Any]],
+    headers: Optional[Dict[str, str]] = None,
+    max_workers: int = MAX_WORKERS,
+) -> List[Dict[str, Any]]:
+    """
+    Send independent payloads concurrently over the shared client.
+
+    Results come back in payload order. Only use this for mutations with
+    no ordering constraints among themselves.
+    """
+    if not payloads:
+        return []
+    if len(payloads) == 1:
+        return [send_graphql_payload(url, payloads[0], headers=headers)]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(
+            pool.map(
+                lambda p: send_graphql_payload(url, p, headers=headers),
+                payloads,
+            )
+        )
+
+
+# ---------- Async sending (httpx) ----------
+#
+# Alternative to the thread pool: one event loop multiplexes all in-flight
+# POSTs over a single HTTP/2 connection, which scales better than threads
+# when shipping many payloads and amortizes the TCP/TLS handshake.
+
+ASYNC_CONCURRENCY = 32
 
-    resp = requests.post(url, json=payload, headers=headers, timeout=timeout)
-    print(f"→ POST {url} -> {resp.status_code}")
 
+async def send_graphql_payload_async(
+    client: "httpx.AsyncClient",
+    url: str,
+    payload: Dict[str, Any],
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 30,
+) -> Dict[str, Any]:
+    """
+    Async counterpart of send_graphql_payload, using a caller-provided
+    httpx async client.
+    """
+    resp = await client.post(
+        url,
+        content=_dumps(payload),
+        headers=headers,
+        timeout=timeout,
+    )
+    print(f"→ POST {url} -> {resp.status_code}")
     try:
         data = resp.json()
-        print(json.dumps(data, indent=2))
+        if DEBUG:
+            print(_dumps(data, pretty=True).decode())
         return data
     except Exception:
         print("Non-JSON response from server:")
@@ -54,18 +198,368 @@ def send_graphql_payload(
         return {"raw": resp.text, "status_code": resp.status_code}
 
 
+async def send_many(
+    url: str,
+    payloads: List[Dict[str, Any]],
+    headers: Optional[Dict[str, str]] = None,
+    concurrency: int = ASYNC_CONCURRENCY,
+) -> List[Dict[str, Any]]:
+    """
+    Send all payloads concurrently (bounded by a semaphore) on one
+    HTTP/2 client. Results come back in payload order.
+    """
+    sem = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(retries=_RETRIES, http2=True),
+        headers={"Content-Type": "application/json"},
+    ) as client:
+
+        async def _one(payload: Dict[str, Any]) -> Dict[str, Any]:
+            async with sem:
+                return await send_graphql_payload_async(
+                    client, url, payload, headers=headers
+                )
+
+        return await asyncio.gather(*(_one(p) for p in payloads))
+
+
+def send_payloads_async(
+    url: str,
+    payloads: List[Dict[str, Any]],
+    headers: Optional[Dict[str, str]] = None,
+    concurrency: int = ASYNC_CONCURRENCY,
+) -> List[Dict[str, Any]]:
+    """Sync entry point: run send_many on a fresh event loop."""
+    if not payloads:
+        return []
+    return asyncio.run(
+        send_many(url, payloads, headers=headers, concurrency=concurrency)
+    )
+
+
+def send_nodes_async(
+    url: str,
+    nodes_inputs: List[Dict[str, Any]],
+    headers: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """Async variant of send_nodes: one createNode payload per node."""
+    payloads = [build_node_payload(node) for node in nodes_inputs]
+    return send_payloads_async(url, payloads, headers=headers)
+
+
+def send_processes_async(
+    url: str,
+    processes_inputs: List[Dict[str, Any]],
+    headers: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """Async variant of send_processes: one createProcess payload per process."""
+    payloads = [build_process_payload(proc) for proc in processes_inputs]
+    return send_payloads_async(url, payloads, headers=headers)
+
+
+def send_markets_async(
+    url: str,
+    markets_inputs: List[Dict[str, Any]],
+    headers: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """Async variant of send_markets: one createMarket payload per market."""
+    payloads = [build_market_payload(market) for market in markets_inputs]
+    return send_payloads_async(url, payloads, headers=headers)
+
+
+def send_risks_async(
+    url: str,
+    risks_inputs: List[Dict[str, Any]],
+    headers: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """Async variant of send_risks: one createRisk payload per risk."""
+    payloads = [build_risk_payload(r) for r in risks_inputs]
+    return send_payloads_async(url, payloads, headers=headers)
+
+
+MAX_BATCH = 100
+
+
+def _post_batch_chunk(
+    url: str,
+    chunk: List[Dict[str, Any]],
+    headers: Optional[Dict[str, str]],
+    timeout: int,
+) -> Any:
+    """POST one JSON-array chunk and parse the response."""
+    resp = _CLIENT.post(url, content=_dumps(chunk), headers=headers, timeout=timeout)
+    print(f"→ POST {url} ({len(chunk)} op(s)) -> {resp.status_code}")
+    try:
+        data = resp.json()
+    except Exception:
+        print("Non-JSON response from server:")
+        print(resp.text)
+        return {"raw": resp.text, "status_code": resp.status_code}
+    if DEBUG:
+        print(_dumps(data, pretty=True).decode())
+    if resp.status_code >= 400:
+        # keep the body for inspection but mark the chunk as failed
+        return {"body": data, "status_code": resp.status_code}
+    return data
+
+
+def batch_responses_ok(responses: List[Any]) -> bool:
+    """
+    True when every chunk in a send_batch/send_batch_parallel result
+    came back as JSON from a 2xx response with no top-level GraphQL
+    errors on any operation. Callers that persist send state should
+    only do so when this holds.
+    """
+    for resp in responses:
+        if isinstance(resp, list):
+            ops = resp
+        elif isinstance(resp, dict):
+            if "status_code" in resp:
+                return False
+            ops = [resp]
+        else:
+            return False
+        for op in ops:
+            if not isinstance(op, dict) or op.get("errors"):
+                return False
+    return True
+
+
+def send_batch(
+    url: str,
+    calls: List[Dict[str, Any]],
+    headers: Optional[Dict[str, str]] = None,
+    chunk_size: int = MAX_BATCH,
+    timeout: int = 30,
+) -> List[Any]:
+    """
+    POST a list of {query, variables} payloads as JSON-array batches
+    (the Apollo-style batching protocol), chunk_size operations per
+    request. Chunks go out sequentially so the server executes the
+    operations in list order. Returns the per-chunk responses.
+    """
+    responses: List[Any] = []
+    for start in range(0, len(calls), chunk_size):
+        chunk = calls[start:start + chunk_size]
+        print(f"\nSending batch of {len(chunk)} operation(s) "
+              f"({start + 1}–{start + len(chunk)} of {len(calls)})")
+        responses.append(_post_batch_chunk(url, chunk, headers, timeout))
+    return responses
+
+
+def send_batch_parallel(
+    url: str,
+    calls: List[Dict[str, Any]],
+    headers: Optional[Dict[str, str]] = None,
+    chunk_size: int = MAX_BATCH,
+    timeout: int = 30,
+    max_workers: int = MAX_WORKERS,
+) -> List[Any]:
+    """
+    Like send_batch, but the chunks go out concurrently over the pooled
+    client. Only use this when the operations have no ordering
+    constraints among themselves.
+    """
+    chunks = [
+        calls[start:start + chunk_size]
+        for start in range(0, len(calls), chunk_size)
+    ]
+    if not chunks:
+        return []
+    if len(chunks) == 1:
+        return [_post_batch_chunk(url, chunks[0], headers, timeout)]
+
+    print(f"\nSending {len(calls)} operation(s) in {len(chunks)} "
+          f"concurrent batch(es)")
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(
+            pool.map(
+                lambda c: _post_batch_chunk(url, c, headers, timeout),
+                chunks,
+            )
+        )
+
+
+# ---------- Batched mutations ----------
+#
+# GraphQL allows several aliased top-level mutation fields in one document,
+# so N createNode/createProcess/... calls can travel in a single HTTP
+# round-trip instead of N. Chunking bounds the payload size per request.
+
+BATCH_SIZE = 50
+
+
+def build_batched_payload(
+    field_name: str,
+    arg_defs: Dict[str, str],
+    selection: str,
+    items: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Build one mutation document with an aliased field per item.
+
+    field_name: mutation field, e.g. "createNode"
+    arg_defs:   argument name -> GraphQL type, e.g. {"node": "NewNode!"}
+    selection:  selection set, e.g. "errors { field message }"
+    items:      one dict per call, argument name -> value
+
+    Produces e.g.:
+      mutation Batch($v0_node: NewNode!, $v1_node: NewNode!) {
+        m0: createNode(node: $v0_node) { errors { field message } }
+        m1: createNode(node: $v1_node) { errors { field message } }
+      }
+    """
+    var_defs: List[str] = []
+    fields: List[str] = []
+    variables: Dict[str, Any] = {}
+
+    for i, item in enumerate(items):
+        args = []
+        for arg_name, arg_type in arg_defs.items():
+            var_name = f"v{i}_{arg_name}"
+            var_defs.append(f"${var_name}: {arg_type}")
+            args.append(f"{arg_name}: ${var_name}")
+            variables[var_name] = item.get(arg_name)
+        fields.append(
+            f"m{i}: {field_name}({', '.join(args)}) {{ {selection} }}"
+        )
+
+    mutation = (
+        f"mutation Batch({', '.join(var_defs)}) {{\n"
+        + "\n".join(fields)
+        + "\n}"
+    )
+    return {"query": mutation, "variables": variables}
+
+
+def send_batched(
+    url: str,
+    field_name: str,
+    arg_defs: Dict[str, str],
+    selection: str,
+    items: List[Dict[str, Any]],
+    headers: Optional[Dict[str, str]] = None,
+    chunk_size: int = BATCH_SIZE,
+) -> List[Dict[str, Any]]:
+    """
+    Send all items as batched multi-field mutations, chunk_size per request.
+    The chunks themselves are independent, so they go out in parallel over
+    the shared client. Items that serialize identically (e.g. a membership
+    listed twice in the CSV) are coalesced and sent once. Returns the list
+    of per-chunk responses.
+    """
+    seen: set = set()
+    unique_items: List[Dict[str, Any]] = []
+    for item in items:
+        key = _payload_key(item)
+        if key in seen:
+            continue
+        seen.add(key)
+        unique_items.append(item)
+    if len(unique_items) < len(items):
+        print(f"Skipping {len(items) - len(unique_items)} duplicate "
+              f"{field_name} mutation(s)")
+    items = unique_items
+
+    payloads: List[Dict[str, Any]] = []
+    for start in range(0, len(items), chunk_size):
+        chunk = items[start:start + chunk_size]
+        payloads.append(
+            build_batched_payload(field_name, arg_defs, selection, chunk)
+        )
+    if payloads:
+        print(f"\nSending {len(items)} {field_name} mutations "
+              f"in {len(payloads)} batch(es)")
+    return send_parallel(url, payloads, headers=headers)
+
+
 def save_payload_to_file(
     payload: Any,          # <- allow dict OR list
     graphql_dir: str,
     filename: str,
+    pretty: bool = False,
 ) -> str:
     """
     Save any GraphQL payload (or list of payloads) to disk.
+    Compact JSON by default; pass pretty=True for files a human will read.
     """
-    os.makedirs(graphql_dir, exist_ok=True)
+    # Callers (the batch save_* helpers / create_folder_structure) have
+    # already created the directory; stat'ing it again per payload is
+    # wasted syscalls.
     out_path = os.path.join(graphql_dir, filename)
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    # Serialize once with orjson and write the bytes in a single call.
+    with open(out_path, "wb", buffering=1 << 20) as f:
+        f.write(_dumps(payload, pretty=pretty))
+    print(f"Saved GraphQL payload: {out_path}")
+    return out_path
+
+
+def save_payloads_tar(payloads_with_names, tar_path: str) -> str:
+    """
+    Write (filename, payload) pairs into one uncompressed tar archive.
+
+    One archive means one inode and sequential writes instead of N file
+    creations — much cheaper for thousands of per-entity payloads.
+    """
+    with tarfile.open(tar_path, "w", bufsize=1 << 20) as tar:
+        for filename, payload in payloads_with_names:
+            data = payload if isinstance(payload, bytes) else _dumps(payload, pretty=True)
+            info = tarfile.TarInfo(filename)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    print(f"Saved GraphQL payload archive: {tar_path}")
+    return tar_path
+
+
+def _stream_json_array(out_path: str, payloads) -> str:
+    """
+    Write an iterable of payloads as one JSON array, encoding and writing
+    incrementally so memory stays at one payload instead of the whole list.
+    Identical payloads are written only once.
+
+    The content is hashed while streaming; if a sidecar <name>.hash from a
+    previous run matches, the existing file is left untouched so no-op
+    reruns cause no disk churn.
+    """
+    seen: set = set()
+    tmp_path = out_path + ".tmp"
+    hash_path = out_path + ".hash"
+    digest = hashlib.blake2b(digest_size=16)
+
+    with open(tmp_path, "wb", buffering=1 << 20) as f:
+        f.write(b"[")
+        digest.update(b"[")
+        first = True
+        for p in payloads:
+            # pre-encoded payloads pass through untouched
+            data = p if isinstance(p, bytes) else _dumps(p)
+            key = hashlib.blake2b(data, digest_size=16).digest()
+            if key in seen:
+                continue
+            seen.add(key)
+            if not first:
+                f.write(b",")
+                digest.update(b",")
+            f.write(data)
+            digest.update(data)
+            first = False
+        f.write(b"]")
+        digest.update(b"]")
+
+    new_hash = digest.hexdigest()
+    old_hash = None
+    if os.path.isfile(hash_path) and os.path.isfile(out_path):
+        with open(hash_path, "r", encoding="utf-8") as f:
+            old_hash = f.read().strip()
+
+    if old_hash == new_hash:
+        os.remove(tmp_path)
+        print(f"Unchanged GraphQL payload: {out_path} (write skipped)")
+        return out_path
+
+    os.replace(tmp_path, out_path)
+    with open(hash_path, "w", encoding="utf-8") as f:
+        f.write(new_hash)
     print(f"Saved GraphQL payload: {out_path}")
     return out_path
 
@@ -87,7 +581,10 @@ mutation CreateInputDataSetup($setup: InputDataSetupInput!) {
 
 
 def build_setup_payload(setup_input: Dict[str, Any]) -> Dict[str, Any]:
-    return build_graphql_payload(_SETUP_MUTATION, {"setup": setup_input})
+    return {
+        "query": _SETUP_MUTATION,
+        "variables": {"setup": setup_input},
+    }
 
 
 def send_setup(
@@ -114,31 +611,36 @@ mutation CreateNode($node: NewNode!) {
 
 
 def build_node_payload(node_input: Dict[str, Any]) -> Dict[str, Any]:
-    return build_graphql_payload(_NODE_MUTATION, {"node": node_input})
+    return {"query": _NODE_MUTATION, "variables": {"node": node_input}}
 
 
-def save_node_payloads_to_files(nodes_inputs: List[Dict[str, Any]], graphql_dir: str):
+def save_node_payloads_to_files(
+    nodes_inputs: List[Dict[str, Any]],
+    graphql_dir: str,
+    archive: bool = False,
+):
     """
     Save one JSON file per node and one combined file with all node payloads.
+    With archive=True the per-node files go into node_payloads.tar instead
+    of individual files.
     """
     os.makedirs(graphql_dir, exist_ok=True)
 
-    all_payloads: List[Dict[str, Any]] = []
-
-    for node in nodes_inputs:
-        name = node.get("name", "node")
-        safe = "".join(c for c in name if c.isalnum() or c in ("_", "-", " ")).strip()
-        if not safe:
-            safe = "node"
-        safe = safe.replace(" ", "_")
-
-        payload = build_node_payload(node)
-        all_payloads.append(payload)
+    entries: List[Any] = []
 
-        filename = f"node_{safe}.json"
-        save_payload_to_file(payload, graphql_dir, filename)
+    def _payloads():
+        for node in nodes_inputs:
+            safe = _safe_name(node.get("name", "node"), "node")
+            payload = build_node_payload(node)
+            if archive:
+                entries.append((f"node_{safe}.json", payload))
+            else:
+                save_payload_to_file(payload, graphql_dir, f"node_{safe}.json", pretty=True)
+            yield payload
 
-    save_payload_to_file(all_payloads, graphql_dir, "nodes_all.json")
+    _stream_json_array(os.path.join(graphql_dir, "nodes_all.json"), _payloads())
+    if archive:
+        save_payloads_tar(entries, os.path.join(graphql_dir, "node_payloads.tar"))
 
 
 def send_nodes(
@@ -147,12 +649,16 @@ def send_nodes(
     headers: Optional[Dict[str, str]] = None,
 ):
     """
-    Send createNode mutation for all nodes, one by one.
+    Send createNode mutations for all nodes, batched.
     """
-    for node in nodes_inputs:
-        print(f"\nSending node: {node.get('name')}")
-        payload = build_node_payload(node)
-        send_graphql_payload(url, payload, headers=headers)
+    send_batched(
+        url,
+        "createNode",
+        {"node": "NewNode!"},
+        "errors { field message }",
+        [{"node": node} for node in nodes_inputs],
+        headers=headers,
+    )
 
 
 # Node state (setNodeState)
@@ -174,43 +680,46 @@ def build_node_state_payload(node_name: str, state_input: Dict[str, Any]) -> Dic
     Build payload for setting state of a single node.
       variables = { nodeName: "...", state: { ...NewState fields... } }
     """
-    variables = {
-        "nodeName": node_name,
-        "state": state_input,
+    return {
+        "query": _STATE_MUTATION,
+        "variables": {"nodeName": node_name, "state": state_input},
     }
-    return build_graphql_payload(_STATE_MUTATION, variables)
 
 
 def save_node_state_payloads_to_files(
     node_states: List[Dict[str, Any]],
     graphql_dir: str,
+    archive: bool = False,
 ):
     """
     node_states: list of {"nodeName": <str>, "state": <NewState dict>}
-    Saves one JSON per node and one combined JSON.
+    Saves one JSON per node and one combined JSON. With archive=True the
+    per-node files go into node_state_payloads.tar instead.
     """
     os.makedirs(graphql_dir, exist_ok=True)
 
-    all_payloads: List[Dict[str, Any]] = []
-
-    for item in node_states:
-        node_name = item.get("nodeName", "node")
-        state = item.get("state", {})
-
-        safe = "".join(
-            c for c in node_name if c.isalnum() or c in ("_", "-", " ")
-        ).strip()
-        if not safe:
-            safe = "node"
-        safe = safe.replace(" ", "_")
-
-        payload = build_node_state_payload(node_name, state)
-        all_payloads.append(payload)
-
-        filename = f"node_state_{safe}.json"
-        save_payload_to_file(payload, graphql_dir, filename)
-
-    save_payload_to_file(all_payloads, graphql_dir, "node_states_all.json")
+    entries: List[Any] = []
+
+    def _payloads():
+        for item in node_states:
+            node_name = item.get("nodeName", "node")
+            state = item.get("state", {})
+
+            safe = _safe_name(node_name, "node")
+            payload = build_node_state_payload(node_name, state)
+            if archive:
+                entries.append((f"node_state_{safe}.json", payload))
+            else:
+                save_payload_to_file(payload, graphql_dir, f"node_state_{safe}.json", pretty=True)
+            yield payload
+
+    _stream_json_array(
+        os.path.join(graphql_dir, "node_states_all.json"), _payloads()
+    )
+    if archive:
+        save_payloads_tar(
+            entries, os.path.join(graphql_dir, "node_state_payloads.tar")
+        )
 
 
 def send_node_states(
@@ -219,17 +728,22 @@ def send_node_states(
     headers: Optional[Dict[str, str]] = None,
 ):
     """
-    Send setNodeState mutation for all given node states, one by one.
+    Send setNodeState mutations for all given node states, batched.
     node_states: list of {"nodeName": <str>, "state": <NewState dict>}
     """
-    for item in node_states:
-        node_name = item.get("nodeName")
-        state = item.get("state")
-        if not node_name or state is None:
-            continue
-        print(f"\nSending node state for: {node_name}")
-        payload = build_node_state_payload(node_name, state)
-        send_graphql_payload(url, payload, headers=headers)
+    items = [
+        {"nodeName": item["nodeName"], "state": item["state"]}
+        for item in node_states
+        if item.get("nodeName") and item.get("state") is not None
+    ]
+    send_batched(
+        url,
+        "setNodeState",
+        {"state": "NewState", "nodeName": "String!"},
+        "errors { field message }",
+        items,
+        headers=headers,
+    )
 
 # Processes (createProcess)
 
@@ -246,34 +760,40 @@ mutation CreateProcess($process: NewProcess!) {
 
 
 def build_process_payload(process_input: Dict[str, Any]) -> Dict[str, Any]:
-    return build_graphql_payload(_PROCESS_MUTATION, {"process": process_input})
+    return {"query": _PROCESS_MUTATION, "variables": {"process": process_input}}
 
 
 def save_process_payloads_to_files(
     processes_inputs: List[Dict[str, Any]],
     graphql_dir: str,
+    archive: bool = False,
 ):
     """
-    Save one JSON file per process and one combined file with all process payloads.
+    Save one JSON file per process and one combined file with all process
+    payloads. With archive=True the per-process files go into
+    process_payloads.tar instead.
     """
     os.makedirs(graphql_dir, exist_ok=True)
 
-    all_payloads: List[Dict[str, Any]] = []
-
-    for proc in processes_inputs:
-        name = proc.get("name", "process")
-        safe = "".join(c for c in name if c.isalnum() or c in ("_", "-", " ")).strip()
-        if not safe:
-            safe = "process"
-        safe = safe.replace(" ", "_")
-
-        payload = build_process_payload(proc)
-        all_payloads.append(payload)
-
-        filename = f"process_{safe}.json"
-        save_payload_to_file(payload, graphql_dir, filename)
-
-    save_payload_to_file(all_payloads, graphql_dir, "processes_all.json")
+    entries: List[Any] = []
+
+    def _payloads():
+        for proc in processes_inputs:
+            safe = _safe_name(proc.get("name", "process"), "process")
+            payload = build_process_payload(proc)
+            if archive:
+                entries.append((f"process_{safe}.json", payload))
+            else:
+                save_payload_to_file(payload, graphql_dir, f"process_{safe}.json", pretty=True)
+            yield payload
+
+    _stream_json_array(
+        os.path.join(graphql_dir, "processes_all.json"), _payloads()
+    )
+    if archive:
+        save_payloads_tar(
+            entries, os.path.join(graphql_dir, "process_payloads.tar")
+        )
 
 
 def send_processes(
@@ -282,12 +802,16 @@ def send_processes(
     headers: Optional[Dict[str, str]] = None,
 ):
     """
-    Send createProcess mutation for all processes, one by one.
+    Send createProcess mutations for all processes, batched.
     """
-    for proc in processes_inputs:
-        print(f"\nSending process: {proc.get('name')}")
-        payload = build_process_payload(proc)
-        send_graphql_payload(url, payload, headers=headers)
+    send_batched(
+        url,
+        "createProcess",
+        {"process": "NewProcess!"},
+        "errors { field message }",
+        [{"process": proc} for proc in processes_inputs],
+        headers=headers,
+    )
 
 # Groups (createNodeGroup / createProcessGroup / addNodeToGroup / addProcessToGroup)
 
@@ -325,21 +849,67 @@ mutation AddProcessToGroup($processName: String!, $groupName: String!) {
 
 
 def build_create_node_group_payload(name: str) -> Dict[str, Any]:
-    return build_graphql_payload(_NODE_GROUP_MUTATION, {"name": name})
+    return {"query": _NODE_GROUP_MUTATION, "variables": {"name": name}}
 
 
 def build_create_process_group_payload(name: str) -> Dict[str, Any]:
-    return build_graphql_payload(_PROCESS_GROUP_MUTATION, {"name": name})
+    return {"query": _PROCESS_GROUP_MUTATION, "variables": {"name": name}}
 
 
 def build_add_node_to_group_payload(node_name: str, group_name: str) -> Dict[str, Any]:
-    vars_ = {"nodeName": node_name, "groupName": group_name}
-    return build_graphql_payload(_ADD_NODE_TO_GROUP_MUTATION, vars_)
+    return {
+        "query": _ADD_NODE_TO_GROUP_MUTATION,
+        "variables": {"nodeName": node_name, "groupName": group_name},
+    }
 
 
 def build_add_process_to_group_payload(process_name: str, group_name: str) -> Dict[str, Any]:
-    vars_ = {"processName": process_name, "groupName": group_name}
-    return build_graphql_payload(_ADD_PROCESS_TO_GROUP_MUTATION, vars_)
+    return {
+        "query": _ADD_PROCESS_TO_GROUP_MUTATION,
+        "variables": {"processName": process_name, "groupName": group_name},
+    }
+
+
+# The group mutation strings never change, so their serialized form is
+# computed once at import; per-call payload bytes just splice in the
+# variables instead of re-encoding the whole query string each time.
+
+def _query_prefix(mutation: str) -> bytes:
+    """Serialized {"query": ...} with the closing brace stripped."""
+    return orjson.dumps({"query": mutation})[:-1]
+
+
+_NODE_GROUP_PREFIX = _query_prefix(_NODE_GROUP_MUTATION)
+_PROCESS_GROUP_PREFIX = _query_prefix(_PROCESS_GROUP_MUTATION)
+_ADD_NODE_TO_GROUP_PREFIX = _query_prefix(_ADD_NODE_TO_GROUP_MUTATION)
+_ADD_PROCESS_TO_GROUP_PREFIX = _query_prefix(_ADD_PROCESS_TO_GROUP_MUTATION)
+
+
+def _payload_bytes(prefix: bytes, variables: Dict[str, Any]) -> bytes:
+    """Complete a pre-encoded query prefix into full payload bytes."""
+    return prefix + b',"variables":' + orjson.dumps(variables) + b"}"
+
+
+def build_create_node_group_payload_bytes(name: str) -> bytes:
+    return _payload_bytes(_NODE_GROUP_PREFIX, {"name": name})
+
+
+def build_create_process_group_payload_bytes(name: str) -> bytes:
+    return _payload_bytes(_PROCESS_GROUP_PREFIX, {"name": name})
+
+
+def build_add_node_to_group_payload_bytes(node_name: str, group_name: str) -> bytes:
+    return _payload_bytes(
+        _ADD_NODE_TO_GROUP_PREFIX,
+        {"nodeName": node_name, "groupName": group_name},
+    )
+
+
+def build_add_process_to_group_payload_bytes(process_name: str, group_name: str) -> bytes:
+    return _payload_bytes(
+        _ADD_PROCESS_TO_GROUP_PREFIX,
+        {"processName": process_name, "groupName": group_name},
+    )
 
 
 def save_group_payloads_to_files(groups_data: Dict[str, Any], graphql_dir: str) -> None:
@@ -352,41 +922,49 @@ def save_group_payloads_to_files(groups_data: Dict[str, Any], graphql_dir: str)
     """
     os.makedirs(graphql_dir, exist_ok=True)
 
-    node_group_payloads: List[Dict[str, Any]] = []
-    for name in groups_data["node_groups"]:
-        payload = build_create_node_group_payload(name)
-        node_group_payloads.append(payload)
-        safe = "".join(c for c in name if c.isalnum() or c in ("_", "-", " ")).strip() or "node_group"
-        safe = safe.replace(" ", "_")
-        save_payload_to_file(payload, graphql_dir, f"node_group_{safe}.json")
-
-    if node_group_payloads:
-        save_payload_to_file(node_group_payloads, graphql_dir, "node_groups_all.json")
-
-    process_group_payloads: List[Dict[str, Any]] = []
-    for name in groups_data["process_groups"]:
-        payload = build_create_process_group_payload(name)
-        process_group_payloads.append(payload)
-        safe = "".join(c for c in name if c.isalnum() or c in ("_", "-", " ")).strip() or "process_group"
-        safe = safe.replace(" ", "_")
-        save_payload_to_file(payload, graphql_dir, f"process_group_{safe}.json")
-
-    if process_group_payloads:
-        save_payload_to_file(process_group_payloads, graphql_dir, "process_groups_all.json")
-
-    node_membership_payloads: List[Dict[str, Any]] = []
-    for m in groups_data["node_memberships"]:
-        payload = build_add_node_to_group_payload(m["nodeName"], m["groupName"])
-        node_membership_payloads.append(payload)
-    if node_membership_payloads:
-        save_payload_to_file(node_membership_payloads, graphql_dir, "node_group_memberships_all.json")
-
-    process_membership_payloads: List[Dict[str, Any]] = []
-    for m in groups_data["process_memberships"]:
-        payload = build_add_process_to_group_payload(m["processName"], m["groupName"])
-        process_membership_payloads.append(payload)
-    if process_membership_payloads:
-        save_payload_to_file(process_membership_payloads, graphql_dir, "process_group_memberships_all.json")
+    def _node_group_payloads():
+        for name in groups_data["node_groups"]:
+            payload = build_create_node_group_payload(name)
+            safe = _safe_name(name, "node_group")
+            save_payload_to_file(payload, graphql_dir, f"node_group_{safe}.json", pretty=True)
+            yield payload
+
+    if groups_data["node_groups"]:
+        _stream_json_array(
+            os.path.join(graphql_dir, "node_groups_all.json"),
+            _node_group_payloads(),
+        )
+
+    def _process_group_payloads():
+        for name in groups_data["process_groups"]:
+            payload = build_create_process_group_payload(name)
+            safe = _safe_name(name, "process_group")
+            save_payload_to_file(payload, graphql_dir, f"process_group_{safe}.json", pretty=True)
+            yield payload
+
+    if groups_data["process_groups"]:
+        _stream_json_array(
+            os.path.join(graphql_dir, "process_groups_all.json"),
+            _process_group_payloads(),
+        )
+
+    if groups_data["node_memberships"]:
+        _stream_json_array(
+            os.path.join(graphql_dir, "node_group_memberships_all.json"),
+            (
+                build_add_node_to_group_payload_bytes(m["nodeName"], m["groupName"])
+                for m in groups_data["node_memberships"]
+            ),
+        )
+
+    if groups_data["process_memberships"]:
+        _stream_json_array(
+            os.path.join(graphql_dir, "process_group_memberships_all.json"),
+            (
+                build_add_process_to_group_payload_bytes(m["processName"], m["groupName"])
+                for m in groups_data["process_memberships"]
+            ),
+        )
 
 
 def send_groups(
@@ -400,6 +978,9 @@ def send_groups(
       2) create process groups
       3) add nodes to groups
       4) add processes to groups
+
+    Each phase is batched; phases stay ordered so groups exist before
+    memberships reference them.
     """
     if not (groups_data["node_groups"] or groups_data["process_groups"] or
             groups_data["node_memberships"] or groups_data["process_memberships"]):
@@ -407,28 +988,44 @@ def send_groups(
         return
 
     # 1) create node groups
-    for name in groups_data["node_groups"]:
-        print(f"\nCreating node group: {name}")
-        payload = build_create_node_group_payload(name)
-        send_graphql_payload(url, payload, headers=headers)
+    send_batched(
+        url,
+        "createNodeGroup",
+        {"name": "String!"},
+        "message",
+        [{"name": name} for name in groups_data["node_groups"]],
+        headers=headers,
+    )
 
     # 2) create process groups
-    for name in groups_data["process_groups"]:
-        print(f"\nCreating process group: {name}")
-        payload = build_create_process_group_payload(name)
-        send_graphql_payload(url, payload, headers=headers)
+    send_batched(
+        url,
+        "createProcessGroup",
+        {"name": "String!"},
+        "message",
+        [{"name": name} for name in groups_data["process_groups"]],
+        headers=headers,
+    )
 
     # 3) add nodes to groups
-    for m in groups_data["node_memberships"]:
-        print(f"\nAdding node {m['nodeName']} to group {m['groupName']}")
-        payload = build_add_node_to_group_payload(m["nodeName"], m["groupName"])
-        send_graphql_payload(url, payload, headers=headers)
+    send_batched(
+        url,
+        "addNodeToGroup",
+        {"nodeName": "String!", "groupName": "String!"},
+        "message",
+        groups_data["node_memberships"],
+        headers=headers,
+    )
 
     # 4) add processes to groups
-    for m in groups_data["process_memberships"]:
-        print(f"\nAdding process {m['processName']} to group {m['groupName']}")
-        payload = build_add_process_to_group_payload(m["processName"], m["groupName"])
-        send_graphql_payload(url, payload, headers=headers)
+    send_batched(
+        url,
+        "addProcessToGroup",
+        {"processName": "String!", "groupName": "String!"},
+        "message",
+        groups_data["process_memberships"],
+        headers=headers,
+    )
 
 # Process topologies (createTopology)
 
@@ -463,13 +1060,15 @@ def build_topology_payload(call_input: Dict[str, Any]) -> Dict[str, Any]:
       "topology": { ... NewTopology fields ... }
     }
     """
-    vars_ = {
-        "topology": call_input["topology"],
-        "sourceNodeName": call_input.get("sourceNodeName"),
-        "processName": call_input["processName"],
-        "sinkNodeName": call_input.get("sinkNodeName"),
+    return {
+        "query": _TOPOLOGY_MUTATION,
+        "variables": {
+            "topology": call_input["topology"],
+            "sourceNodeName": call_input.get("sourceNodeName"),
+            "processName": call_input["processName"],
+            "sinkNodeName": call_input.get("sinkNodeName"),
+        },
     }
-    return build_graphql_payload(_TOPOLOGY_MUTATION, vars_)
 
 
 def save_topology_payloads_to_files(
@@ -482,8 +1081,11 @@ def save_topology_payloads_to_files(
     if not topo_calls:
         return
 
-    payloads = [build_topology_payload(t) for t in topo_calls]
-    save_payload_to_file(payloads, graphql_dir, "topologies_all.json")
+    os.makedirs(graphql_dir, exist_ok=True)
+    _stream_json_array(
+        os.path.join(graphql_dir, "topologies_all.json"),
+        (build_topology_payload(t) for t in topo_calls),
+    )
 
 
 def send_topologies(
@@ -492,15 +1094,30 @@ def send_topologies(
     headers: Optional[Dict[str, str]] = None,
 ) -> None:
     """
-    Send createTopology for each topology definition.
+    Send createTopology for all topology definitions, batched.
     """
-    for t in topo_calls:
-        print(
-            f"\nSending topology: process={t['processName']}, "
-            f"source={t.get('sourceNodeName')}, sink={t.get('sinkNodeName')}"
-        )
-        payload = build_topology_payload(t)
-        send_graphql_payload(url, payload, headers=headers)
+    items = [
+        {
+            "topology": t["topology"],
+            "sourceNodeName": t.get("sourceNodeName"),
+            "processName": t["processName"],
+            "sinkNodeName": t.get("sinkNodeName"),
+        }
+        for t in topo_calls
+    ]
+    send_batched(
+        url,
+        "createTopology",
+        {
+            "topology": "NewTopology!",
+            "sourceNodeName": "String",
+            "processName": "String!",
+            "sinkNodeName": "String",
+        },
+        "errors { field message }",
+        items,
+        headers=headers,
+    )
 
 
 # Markets (createMarket)
@@ -521,37 +1138,43 @@ def build_market_payload(market_input: Dict[str, Any]) -> Dict[str, Any]:
     """
     Build GraphQL payload for a single NewMarket input.
     """
-    return build_graphql_payload(_MARKET_MUTATION, {"market": market_input})
+    return {"query": _MARKET_MUTATION, "variables": {"market": market_input}}
 
 
 def save_market_payloads_to_files(
     markets_inputs: List[Dict[str, Any]],
     graphql_dir: str,
+    archive: bool = False,
 ) -> None:
     """
-    Save one JSON file per market and one combined file with all market payloads.
+    Save one JSON file per market and one combined file with all market
+    payloads. With archive=True the per-market files go into
+    market_payloads.tar instead.
     """
     if not markets_inputs:
         return
 
     os.makedirs(graphql_dir, exist_ok=True)
 
-    all_payloads: List[Dict[str, Any]] = []
-
-    for market in markets_inputs:
-        name = market.get("name", "market")
-        safe = "".join(c for c in name if c.isalnum() or c in ("_", "-", " ")).strip()
-        if not safe:
-            safe = "market"
-        safe = safe.replace(" ", "_")
-
-        payload = build_market_payload(market)
-        all_payloads.append(payload)
-
-        filename = f"market_{safe}.json"
-        save_payload_to_file(payload, graphql_dir, filename)
-
-    save_payload_to_file(all_payloads, graphql_dir, "markets_all.json")
+    entries: List[Any] = []
+
+    def _payloads():
+        for market in markets_inputs:
+            safe = _safe_name(market.get("name", "market"), "market")
+            payload = build_market_payload(market)
+            if archive:
+                entries.append((f"market_{safe}.json", payload))
+            else:
+                save_payload_to_file(payload, graphql_dir, f"market_{safe}.json", pretty=True)
+            yield payload
+
+    _stream_json_array(
+        os.path.join(graphql_dir, "markets_all.json"), _payloads()
+    )
+    if archive:
+        save_payloads_tar(
+            entries, os.path.join(graphql_dir, "market_payloads.tar")
+        )
 
 
 def send_markets(
@@ -560,12 +1183,16 @@ def send_markets(
     headers: Optional[Dict[str, str]] = None,
 ) -> None:
     """
-    Send createMarket mutation for all markets, one by one.
+    Send createMarket mutations for all markets, batched.
     """
-    for market in markets_inputs:
-        print(f"\nSending market: {market.get('name')}")
-        payload = build_market_payload(market)
-        send_graphql_payload(url, payload, headers=headers)
+    send_batched(
+        url,
+        "createMarket",
+        {"market": "NewMarket!"},
+        "errors { field message }",
+        [{"market": market} for market in markets_inputs],
+        headers=headers,
+    )
 
 # Risk (createRisk)
 
@@ -585,7 +1212,7 @@ def build_risk_payload(risk_input: Dict[str, Any]) -> Dict[str, Any]:
     """
     Build GraphQL payload for a single NewRisk input.
     """
-    return build_graphql_payload(_RISK_MUTATION, {"risk": risk_input})
+    return {"query": _RISK_MUTATION, "variables": {"risk": risk_input}}
 
 
 def save_risk_payloads_to_files(
@@ -600,10 +1227,10 @@ def save_risk_payloads_to_files(
 
     os.makedirs(graphql_dir, exist_ok=True)
 
-    payloads: List[Dict[str, Any]] = [
-        build_risk_payload(r) for r in risks_inputs
-    ]
-    save_payload_to_file(payloads, graphql_dir, "risks_all.json")
+    _stream_json_array(
+        os.path.join(graphql_dir, "risks_all.json"),
+        (build_risk_payload(r) for r in risks_inputs),
+    )
 
 
 def send_risks(
@@ -612,12 +1239,16 @@ def send_risks(
     headers: Optional[Dict[str, str]] = None,
 ) -> None:
     """
-    Send createRisk mutation for all risks, one by one.
+    Send createRisk mutations for all risks, batched.
     """
-    for r in risks_inputs:
-        print(f"\nSending risk: {r.get('parameter')}")
-        payload = build_risk_payload(r)
-        send_graphql_payload(url, payload, headers=headers)
+    send_batched(
+        url,
+        "createRisk",
+        {"risk": "NewRisk!"},
+        "errors { field message }",
+        [{"risk": r} for r in risks_inputs],
+        headers=headers,
+    )
 
 # Scenarios (createScenario)
 
@@ -631,8 +1262,7 @@ mutation CreateScenario($name: String!, $weight: Float!) {
 
 
 def build_scenario_payload(name: str, weight: float) -> Dict[str, Any]:
-    variables = {"name": name, "weight": weight}
-    return build_graphql_payload(_SCENARIO_MUTATION, variables)
+    return {"query": _SCENARIO_MUTATION, "variables": {"name": name, "weight": weight}}
 
 
 def save_scenario_payloads_to_files(
@@ -646,10 +1276,11 @@ def save_scenario_payloads_to_files(
     if not scenarios:
         return
 
-    payloads: List[Dict[str, Any]] = [
-        build_scenario_payload(s["name"], s["weight"]) for s in scenarios
-    ]
-    save_payload_to_file(payloads, graphql_dir, "scenarios_all.json")
+    os.makedirs(graphql_dir, exist_ok=True)
+    _stream_json_array(
+        os.path.join(graphql_dir, "scenarios_all.json"),
+        (build_scenario_payload(s["name"], s["weight"]) for s in scenarios),
+    )
 
 
 def send_scenarios(
@@ -658,12 +1289,14 @@ def send_scenarios(
     headers: Optional[Dict[str, str]] = None,
 ) -> None:
     """
-    Send createScenario for all scenarios, one by one.
+    Send createScenario for all scenarios, batched.
     """
-    for s in scenarios:
-        name = s["name"]
-        weight = s["weight"]
-        print(f"\nSending scenario: {name} (weight={weight})")
-        payload = build_scenario_payload(name, weight)
-        send_graphql_payload(url, payload, headers=headers)
+    send_batched(
+        url,
+        "createScenario",
+        {"name": "String!", "weight": "Float!"},
+        "message",
+        [{"name": s["name"], "weight": s["weight"]} for s in scenarios],
+        headers=headers,
+    )
 
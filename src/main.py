@@ -1,13 +1,15 @@
+import hashlib
 import os
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import orjson
 
 from excel_to_csv import create_folder_structure, excel_to_csv
 from parse_setup import parse_setup_csv_to_inputdatasetup
-from parse_nodes import (
-    parse_nodes_csv_to_newnodes,
-    parse_node_states_from_nodes_csv,
-)
+from parse_nodes import parse_nodes_and_states
 from parse_processes import parse_processes_csv_to_newprocesses
 from parse_groups import parse_groups_csv
 from parse_topologies import parse_process_topologies_csv_to_inputs
@@ -20,24 +22,29 @@ from parse_risk import parse_risk_csv_to_newrisks
 from parse_scenarios import parse_scenarios_csv_to_list
 from graphql_utils import (
     build_setup_payload,
+    build_node_payload,
+    build_node_state_payload,
+    build_process_payload,
+    build_create_node_group_payload,
+    build_create_process_group_payload,
+    build_add_node_to_group_payload,
+    build_add_process_to_group_payload,
+    build_topology_payload,
+    build_market_payload,
+    build_risk_payload,
+    build_scenario_payload,
     save_payload_to_file,
     save_node_payloads_to_files,
     save_node_state_payloads_to_files,
     save_process_payloads_to_files,
     save_group_payloads_to_files,
     save_topology_payloads_to_files,
-    send_setup,
-    send_nodes,
-    send_node_states,
-    send_processes,
-    send_groups,
-    send_topologies,
     save_market_payloads_to_files,
-    send_markets,
-    save_risk_payloads_to_files, 
-    send_risks,
-    save_scenario_payloads_to_files, 
-    send_scenarios,
+    save_risk_payloads_to_files,
+    save_scenario_payloads_to_files,
+    send_batch_parallel,
+    batch_responses_ok,
+    MAX_WORKERS,
 )
 
 # --- Config ---
@@ -48,6 +55,65 @@ GRAPHQL_HEADERS = {
 }
 SEND_TO_SERVER = True
 
+# Cap on concurrent send workers. Past the server's own connection pool
+# size, extra client concurrency stops helping and starts hurting, so
+# keep this at (or below) the GraphQL server's pool width. graphql_utils
+# reads HERTTA_SEND_CONCURRENCY and sizes its connection pool to match.
+SEND_CONCURRENCY = MAX_WORKERS
+
+# Serializing parsed structures just to echo them on stdout costs a full
+# traversal of every payload; only do it when explicitly debugging.
+DEBUG = os.environ.get("HERTTA_DEBUG") == "1"
+
+# Source CSVs per send category; a category is only re-sent when one of
+# its inputs changed since the last successful send.
+_SEND_SOURCES = {
+    "setup": ("setup.csv",),
+    "scenarios": ("scenarios.csv",),
+    "nodes": ("nodes.csv", "price.csv", "inflow.csv"),
+    "processes": ("processes.csv", "cf.csv"),
+    "groups": ("groups.csv",),
+    "topologies": ("process_topology.csv",),
+    "markets": ("markets.csv", "market_prices.csv"),
+    "risks": ("risk.csv",),
+}
+
+
+def _file_sha1(path: Path) -> str:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return ""
+
+
+def _changed_categories(csv_dir: Path, state_path: Path):
+    """
+    Hash each category's source CSVs and compare against the hashes
+    recorded after the last successful send. Returns (changed set,
+    current hashes).
+    """
+    hashes = {
+        cat: "|".join(_file_sha1(csv_dir / name) for name in names)
+        for cat, names in _SEND_SOURCES.items()
+    }
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            last_sent = json.load(f)
+    except (OSError, ValueError):
+        last_sent = {}
+    changed = {cat for cat, h in hashes.items() if h != last_sent.get(cat)}
+    return changed, hashes
+
+
+def _preview(obj, limit: int = 2000) -> str:
+    """Size-bounded pretty JSON preview so DEBUG output stays constant
+    cost even when a category holds megabytes of time series."""
+    s = orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    if len(s) <= limit:
+        return s
+    return s[:limit] + f"... [{len(s) - limit} chars truncated]"
+
 
 def main(excel_file: str) -> None:
     excel_path = os.path.abspath(excel_file)
@@ -59,220 +125,336 @@ def main(excel_file: str) -> None:
     # 2) Convert Excel → CSV files into output/csv
     excel_to_csv(excel_path, dirs["csv"])
 
-    # ---------- setup.csv → InputDataSetupInput ----------
+    # 3) Parse every category. The CSVs have no dependency on each other
+    #    until the attach phase, so run the parsers concurrently: file
+    #    reads release the GIL, letting one parser's CPU work overlap
+    #    another's I/O. nodes + node states stay on a single task so
+    #    nodes.csv is still read only once.
+    # Path objects once up front instead of ten os.path.join string
+    # joins further down.
+    csv_dir = Path(dirs["csv"])
+    gql_dir = Path(dirs["graphql"])
+    print(f"\nParsing CSV files from: {csv_dir}")
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        setup_f = ex.submit(
+            parse_setup_csv_to_inputdatasetup, csv_dir / "setup.csv"
+        )
+        nodes_f = ex.submit(
+            parse_nodes_and_states, csv_dir / "nodes.csv"
+        )
+        price_f = ex.submit(
+            parse_node_price_csv_to_costs, csv_dir / "price.csv"
+        )
+        inflow_f = ex.submit(
+            parse_inflow_csv_to_node_inflow, csv_dir / "inflow.csv"
+        )
+        processes_f = ex.submit(
+            parse_processes_csv_to_newprocesses,
+            csv_dir / "processes.csv",
+        )
+        cf_f = ex.submit(
+            parse_cf_csv_to_process_cf, csv_dir / "cf.csv"
+        )
+        topo_f = ex.submit(
+            parse_process_topologies_csv_to_inputs,
+            csv_dir / "process_topology.csv",
+        )
+        groups_f = ex.submit(
+            parse_groups_csv, csv_dir / "groups.csv"
+        )
+        markets_f = ex.submit(
+            parse_markets_csv_to_newmarkets, csv_dir / "markets.csv"
+        )
+        market_prices_f = ex.submit(
+            parse_market_prices_csv_to_prices,
+            csv_dir / "market_prices.csv",
+        )
+        risk_f = ex.submit(
+            parse_risk_csv_to_newrisks, csv_dir / "risk.csv"
+        )
+        scenarios_f = ex.submit(
+            parse_scenarios_csv_to_list, csv_dir / "scenarios.csv"
+        )
+
+        setup_input = setup_f.result()
+        nodes_inputs, node_states = nodes_f.result()
+        node_price_map = price_f.result()
+        inflow_map = inflow_f.result()
+        processes_inputs = processes_f.result()
+        cf_map = cf_f.result()
+        topo_calls = topo_f.result()
+        groups_data = groups_f.result()
+        markets_inputs = markets_f.result()
+        market_price_map = market_prices_f.result()
+        risks_inputs = risk_f.result()
+        scenarios = scenarios_f.result()
+
+    # Disk writes are independent of everything that follows them, so
+    # each category's save_* call is handed to a small background pool
+    # as soon as its data is final. The writes then overlap later
+    # attach work and the HTTP send phase; the pool is drained at the
+    # end of main.
+    saver = ThreadPoolExecutor(max_workers=4)
+    save_futures = []
 
-    setup_csv_path = os.path.join(dirs["csv"], "setup.csv")
-    print(f"\nReading setup from: {setup_csv_path}")
-    setup_input = parse_setup_csv_to_inputdatasetup(setup_csv_path)
+    # ---------- setup.csv → InputDataSetupInput ----------
 
-    print("\nInputDataSetupInput object:")
-    print(json.dumps(setup_input, indent=2))
+    if DEBUG:
+        print("\nInputDataSetupInput object:")
+        print(_preview(setup_input))
 
     setup_payload = build_setup_payload(setup_input)
-    save_payload_to_file(setup_payload, dirs["graphql"], "inputdatasetup.json")
+    save_futures.append(saver.submit(
+        save_payload_to_file, setup_payload, gql_dir,
+        "inputdatasetup.json", pretty=True,
+    ))
 
     # ---------- nodes.csv → NewNode inputs ----------
 
-    nodes_csv_path = os.path.join(dirs["csv"], "nodes.csv")
-    print(f"\nReading nodes from: {nodes_csv_path}")
-    nodes_inputs = parse_nodes_csv_to_newnodes(nodes_csv_path)
-
     print(f"\nParsed {len(nodes_inputs)} nodes.")
-    if nodes_inputs:
+    if DEBUG and nodes_inputs:
         print("Example first node:")
-        print(json.dumps(nodes_inputs[0], indent=2))
-
-    # ---------- price.csv → node cost (ValueInput) ----------
-
-    price_csv_path = os.path.join(dirs["csv"], "price.csv")
-    print(f"\nReading node prices from: {price_csv_path}")
-    node_price_map = parse_node_price_csv_to_costs(price_csv_path)
-
-    if node_price_map:
-        for node in nodes_inputs:
-            name = node.get("name")
-            if name in node_price_map:
-                node["cost"] = node_price_map[name]
-        print("Attached node prices to nodes where available.")
-        print("Example first node after prices:")
-        print(json.dumps(nodes_inputs[0], indent=2))
-    else:
+        print(_preview(nodes_inputs[0]))
+
+    # ---------- price.csv / inflow.csv → node cost & inflow ----------
+
+    # Attach prices and inflow by iterating the (usually much smaller)
+    # maps against a one-off {name: node} index, instead of scanning
+    # every node per category.
+    if node_price_map or inflow_map:
+        nodes_by_name = {n["name"]: n for n in nodes_inputs}
+        node_get = nodes_by_name.get
+        for name, cost in node_price_map.items():
+            node = node_get(name)
+            if node is not None:
+                node["cost"] = cost
+        for name, inflow in inflow_map.items():
+            node = node_get(name)
+            if node is not None:
+                node["inflow"] = inflow
+        print("Attached node prices and inflow to nodes where available.")
+        if DEBUG and nodes_inputs:
+            print("Example first node after prices/inflow:")
+            print(_preview(nodes_inputs[0]))
+    if not node_price_map:
         print("No node price data found; leaving node cost arrays (cost) as-is.")
-
-
-    # ---------- inflow.csv → node inflow (ForecastValueInput) ----------
-
-    inflow_csv_path = os.path.join(dirs["csv"], "inflow.csv")
-    print(f"\nReading node inflow from: {inflow_csv_path}")
-    inflow_map = parse_inflow_csv_to_node_inflow(inflow_csv_path)
-
-    if inflow_map:
-        for node in nodes_inputs:
-            name = node.get("name")
-            if name in inflow_map:
-                node["inflow"] = inflow_map[name]
-        print("Attached inflow to nodes where available.")
-        print("Example first node after inflow:")
-        print(json.dumps(nodes_inputs[0], indent=2))
-    else:
+    if not inflow_map:
         print("No inflow data found; leaving node inflow arrays empty.")
 
-    save_node_payloads_to_files(nodes_inputs, dirs["graphql"])
+    save_futures.append(
+        saver.submit(save_node_payloads_to_files, nodes_inputs, gql_dir)
+    )
 
     # ---------- nodes.csv → node states (NewState) ----------
 
-    print(f"\nReading node states from: {nodes_csv_path}")
-    node_states = parse_node_states_from_nodes_csv(nodes_csv_path)
-
     print(f"\nParsed {len(node_states)} node states.")
-    if node_states:
+    if DEBUG and node_states:
         print("Example first node state:")
-        print(json.dumps(node_states[0], indent=2))
+        print(_preview(node_states[0]))
 
-    save_node_state_payloads_to_files(node_states, dirs["graphql"])
+    save_futures.append(
+        saver.submit(save_node_state_payloads_to_files, node_states, gql_dir)
+    )
 
     # ---------- processes.csv → NewProcess inputs ----------
 
-    processes_csv_path = os.path.join(dirs["csv"], "processes.csv")
-    print(f"\nReading processes from: {processes_csv_path}")
-    processes_inputs = parse_processes_csv_to_newprocesses(processes_csv_path)
-
     print(f"\nParsed {len(processes_inputs)} processes.")
-    if processes_inputs:
+    if DEBUG and processes_inputs:
         print("Example first process:")
-        print(json.dumps(processes_inputs[0], indent=2))
+        print(_preview(processes_inputs[0]))
 
         # ---------- cf.csv → process CF time series ----------
 
-    cf_csv_path = os.path.join(dirs["csv"], "cf.csv")
-    print(f"\nReading process CF from: {cf_csv_path}")
-    cf_map = parse_cf_csv_to_process_cf(cf_csv_path)
-
-    # Attach CF to matching processes
+    # Attach CF to matching processes via a {name: process} index
     if cf_map:
-        for proc in processes_inputs:
-            name = proc.get("name")
-            if name in cf_map:
-                proc["cf"] = cf_map[name]
+        processes_by_name = {p["name"]: p for p in processes_inputs}
+        for name, cf in cf_map.items():
+            proc = processes_by_name.get(name)
+            if proc is not None:
+                proc["cf"] = cf
         print("Attached CF to processes where available.")
-        print("Example first process after CF:")
-        print(json.dumps(processes_inputs[0], indent=2))
+        if DEBUG and processes_inputs:
+            print("Example first process after CF:")
+            print(_preview(processes_inputs[0]))
     else:
         print("No CF data found; leaving process cf arrays empty.")
 
-    save_process_payloads_to_files(processes_inputs, dirs["graphql"])
+    save_futures.append(
+        saver.submit(save_process_payloads_to_files, processes_inputs, gql_dir)
+    )
 
         # ---------- process_topologies.csv → createTopology calls ----------
 
-    topo_csv_path = os.path.join(dirs["csv"], "process_topology.csv")
-    print(f"\nReading process topologies from: {topo_csv_path}")
-    topo_calls = parse_process_topologies_csv_to_inputs(topo_csv_path)
-
     print(f"\nParsed {len(topo_calls)} process topologies.")
-    if topo_calls:
+    if DEBUG and topo_calls:
         print("Example first topology call:")
-        print(json.dumps(topo_calls[0], indent=2))
+        print(_preview(topo_calls[0]))
 
-    save_topology_payloads_to_files(topo_calls, dirs["graphql"])
+    save_futures.append(
+        saver.submit(save_topology_payloads_to_files, topo_calls, gql_dir)
+    )
 
         # ---------- groups.csv → groups & memberships ----------
 
-    groups_csv_path = os.path.join(dirs["csv"], "groups.csv")
-    print(f"\nReading groups from: {groups_csv_path}")
-    groups_data = parse_groups_csv(groups_csv_path)
-
     total_groups = len(groups_data["node_groups"]) + len(groups_data["process_groups"])
     total_memberships = len(groups_data["node_memberships"]) + len(groups_data["process_memberships"])
     print(f"\nParsed {total_groups} groups and {total_memberships} memberships.")
-    if total_groups or total_memberships:
+    if DEBUG and (total_groups or total_memberships):
         print("Groups data preview:")
-        print(json.dumps(groups_data, indent=2))
+        print(_preview(groups_data))
 
-    save_group_payloads_to_files(groups_data, dirs["graphql"])
+    save_futures.append(
+        saver.submit(save_group_payloads_to_files, groups_data, gql_dir)
+    )
 
-        # ---------- markets.csv → NewMarket inputs ----------
-    
-    markets_csv_path = os.path.join(dirs["csv"], "markets.csv")
-    print(f"\nReading markets from: {markets_csv_path}")
-    markets_inputs = parse_markets_csv_to_newmarkets(markets_csv_path)
-
-        # ---------- market_prices.csv → market.price (ForecastValueInput) ----------
-
-    market_prices_csv_path = os.path.join(dirs["csv"], "market_prices.csv")
-    print(f"\nReading market prices from: {market_prices_csv_path}")
-    market_price_map = parse_market_prices_csv_to_prices(market_prices_csv_path)
+        # ---------- markets.csv + market_prices.csv → NewMarket inputs ----------
 
     if market_price_map:
-        for market in markets_inputs:
-            name = market.get("name")
-            if name in market_price_map:
-                market["price"] = market_price_map[name]
+        markets_by_name = {m["name"]: m for m in markets_inputs}
+        for name, price in market_price_map.items():
+            market = markets_by_name.get(name)
+            if market is not None:
+                market["price"] = price
         print("Attached price time series to markets where available.")
-        if markets_inputs:
+        if DEBUG and markets_inputs:
             print("Example first market after prices:")
-            print(json.dumps(markets_inputs[0], indent=2))
+            print(_preview(markets_inputs[0]))
     else:
         print("No market price data found; leaving market price arrays empty.")
 
     print(f"\nParsed {len(markets_inputs)} markets.")
-    if markets_inputs:
+    if DEBUG and markets_inputs:
         print("Example first market:")
-        print(json.dumps(markets_inputs[0], indent=2))
+        print(_preview(markets_inputs[0]))
 
-    save_market_payloads_to_files(markets_inputs, dirs["graphql"])
+    save_futures.append(
+        saver.submit(save_market_payloads_to_files, markets_inputs, gql_dir)
+    )
 
         # ---------- risk.csv → NewRisk inputs ----------
 
-    risk_csv_path = os.path.join(dirs["csv"], "risk.csv")  # sheet "risk" -> risk.csv
-    print(f"\nReading risk from: {risk_csv_path}")
-    risks_inputs = parse_risk_csv_to_newrisks(risk_csv_path)
-
     print(f"\nParsed {len(risks_inputs)} risk parameters.")
-    if risks_inputs:
+    if DEBUG and risks_inputs:
         print("Risk data:")
-        print(json.dumps(risks_inputs, indent=2))
+        print(_preview(risks_inputs))
 
-    save_risk_payloads_to_files(risks_inputs, dirs["graphql"])
+    save_futures.append(
+        saver.submit(save_risk_payloads_to_files, risks_inputs, gql_dir)
+    )
 
-    scenarios_csv_path = os.path.join(dirs["csv"], "scenarios.csv")
-    print(f"\nReading scenarios from: {scenarios_csv_path}")
-    scenarios = parse_scenarios_csv_to_list(scenarios_csv_path)
+        # ---------- scenarios.csv → scenario list ----------
 
     print(f"\nParsed {len(scenarios)} scenarios.")
-    if scenarios:
+    if DEBUG and scenarios:
         print("Scenario data:")
-        print(json.dumps(scenarios, indent=2))
+        print(_preview(scenarios))
 
-    save_scenario_payloads_to_files(scenarios, dirs["graphql"])
+    save_futures.append(
+        saver.submit(save_scenario_payloads_to_files, scenarios, gql_dir)
+    )
 
 
     if SEND_TO_SERVER:
-        print(f"\nSending setup mutation to {GRAPHQL_URL}")
-        send_setup(GRAPHQL_URL, setup_input, headers=GRAPHQL_HEADERS)
-
-        print(f"\nSending {len(scenarios)} scenario mutations to {GRAPHQL_URL}")
-        send_scenarios(GRAPHQL_URL, scenarios, headers=GRAPHQL_HEADERS)
-
-        print(f"\nSending {len(nodes_inputs)} node mutations to {GRAPHQL_URL}")
-        send_nodes(GRAPHQL_URL, nodes_inputs, headers=GRAPHQL_HEADERS)
-
-        print(f"\nSending {len(node_states)} node state mutations to {GRAPHQL_URL}")
-        send_node_states(GRAPHQL_URL, node_states, headers=GRAPHQL_HEADERS)
-
-        print(f"\nSending {len(processes_inputs)} process mutations to {GRAPHQL_URL}")
-        send_processes(GRAPHQL_URL, processes_inputs, headers=GRAPHQL_HEADERS)
-
-        print("\nSending group mutations to GraphQL")
-        send_groups(GRAPHQL_URL, groups_data, headers=GRAPHQL_HEADERS)
-
-        print(f"\nSending {len(topo_calls)} topology mutations to {GRAPHQL_URL}")
-        send_topologies(GRAPHQL_URL, topo_calls, headers=GRAPHQL_HEADERS)
-
-        print(f"\nSending {len(markets_inputs)} market mutations to {GRAPHQL_URL}")
-        send_markets(GRAPHQL_URL, markets_inputs, headers=GRAPHQL_HEADERS)
-
-        print(f"\nSending {len(risks_inputs)} risk mutations to {GRAPHQL_URL}")
-        send_risks(GRAPHQL_URL, risks_inputs, headers=GRAPHQL_HEADERS)
+        # Re-send only the categories whose source CSVs actually changed
+        # since the last successful send.
+        state_path = gql_dir / ".sent_hashes.json"
+        changed, hashes = _changed_categories(csv_dir, state_path)
+        skipped = sorted(_SEND_SOURCES.keys() - changed)
+        if skipped:
+            print(f"\nUnchanged since last send, skipping: {', '.join(skipped)}")
+
+        # Three dependency stages: setup and scenarios first (node and
+        # process inputs reference scenario names), then the entity
+        # creates, then the mutations referencing those entities.
+        # Operations inside a stage are mutually independent, so each
+        # stage's batches can go out concurrently over the pooled
+        # client — but the stages themselves run in order.
+        stage0 = []
+        if "setup" in changed:
+            stage0.append(build_setup_payload(setup_input))
+        if "scenarios" in changed:
+            stage0 += [
+                build_scenario_payload(s["name"], s["weight"]) for s in scenarios
+            ]
+
+        stage1 = []
+        if "nodes" in changed:
+            stage1 += [build_node_payload(node) for node in nodes_inputs]
+        if "processes" in changed:
+            stage1 += [build_process_payload(proc) for proc in processes_inputs]
+        if "groups" in changed:
+            stage1 += [
+                build_create_node_group_payload(name)
+                for name in groups_data["node_groups"]
+            ]
+            stage1 += [
+                build_create_process_group_payload(name)
+                for name in groups_data["process_groups"]
+            ]
+
+        stage2 = []
+        if "nodes" in changed:
+            stage2 += [
+                build_node_state_payload(item["nodeName"], item["state"])
+                for item in node_states
+            ]
+        if "groups" in changed:
+            stage2 += [
+                build_add_node_to_group_payload(m["nodeName"], m["groupName"])
+                for m in groups_data["node_memberships"]
+            ]
+            stage2 += [
+                build_add_process_to_group_payload(m["processName"], m["groupName"])
+                for m in groups_data["process_memberships"]
+            ]
+        if "topologies" in changed:
+            stage2 += [build_topology_payload(t) for t in topo_calls]
+        if "markets" in changed:
+            stage2 += [build_market_payload(market) for market in markets_inputs]
+        if "risks" in changed:
+            stage2 += [build_risk_payload(r) for r in risks_inputs]
+
+        if stage0 or stage1 or stage2:
+            print(f"\nSending {len(stage0) + len(stage1) + len(stage2)} "
+                  f"mutations to {GRAPHQL_URL} in dependency stages")
+            ok = True
+            if stage0:
+                ok &= batch_responses_ok(
+                    send_batch_parallel(GRAPHQL_URL, stage0,
+                                        headers=GRAPHQL_HEADERS,
+                                        max_workers=SEND_CONCURRENCY)
+                )
+            if stage1:
+                ok &= batch_responses_ok(
+                    send_batch_parallel(GRAPHQL_URL, stage1,
+                                        headers=GRAPHQL_HEADERS,
+                                        max_workers=SEND_CONCURRENCY)
+                )
+            if stage2:
+                ok &= batch_responses_ok(
+                    send_batch_parallel(GRAPHQL_URL, stage2,
+                                        headers=GRAPHQL_HEADERS,
+                                        max_workers=SEND_CONCURRENCY)
+                )
+            # record the new hashes only after a fully clean send; a
+            # failed send keeps the old state so it retries next run
+            if ok:
+                try:
+                    with open(state_path, "w", encoding="utf-8") as f:
+                        json.dump(hashes, f, indent=2)
+                except OSError:
+                    pass
+            else:
+                print("\nSome sends failed; keeping previous send state "
+                      "so the changed categories retry next run.")
+        else:
+            print("\nAll categories unchanged since last send; nothing to send.")
+
+    # Drain the background writers; surfacing any write error here
+    # rather than losing it with the pool.
+    for fut in save_futures:
+        fut.result()
+    saver.shutdown()
 
     print("\nAll done.")
 
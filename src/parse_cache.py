@@ -0,0 +1,52 @@
+import hashlib
+import os
+import pickle
+from functools import wraps
+
+
+def cached_parse(fn):
+    """
+    Memoize a parse_*(csv_path) function on disk.
+
+    The cache key is (function name, absolute path, mtime_ns, size), so a
+    regenerated CSV invalidates automatically. Cached results are pickled
+    into a .parse_cache directory next to the CSV; warm runs cost one
+    os.stat plus one pickle.load instead of a full re-parse.
+
+    Calls with extra arguments, or for paths that cannot be stat'ed
+    (missing files take the parser's own fast path), go straight through.
+    """
+
+    @wraps(fn)
+    def wrapper(path, *args, **kwargs):
+        if args or kwargs:
+            return fn(path, *args, **kwargs)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return fn(path)
+
+        abs_path = os.path.abspath(path)
+        key = f"{fn.__name__}:{abs_path}:{st.st_mtime_ns}:{st.st_size}"
+        cache_dir = os.path.join(os.path.dirname(abs_path), ".parse_cache")
+        cache_path = os.path.join(
+            cache_dir, hashlib.sha1(key.encode()).hexdigest() + ".pkl"
+        )
+
+        if os.path.isfile(cache_path):
+            try:
+                with open(cache_path, "rb") as f:
+                    return pickle.load(f)
+            except Exception:
+                pass  # unreadable/corrupt cache entry → re-parse
+
+        result = fn(path)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # cache write is best-effort
+        return result
+
+    return wrapper
@@ -0,0 +1,38 @@
+import os
+
+import pandas as pd
+
+# Opt-in multi-threaded CSV decoding: HERTTA_CSV_ENGINE=arrow routes
+# reads through pandas' pyarrow engine, which scales with cores on the
+# wide time-series files. The C engine stays the default for
+# compatibility (and because pyarrow is not a hard dependency).
+_CSV_ENGINE = os.environ.get("HERTTA_CSV_ENGINE", "c")
+
+
+def read_csv(path, dtype=None, na_filter: bool = True, usecols=None) -> pd.DataFrame:
+    """
+    pd.read_csv with the options every parser here wants: the C engine
+    pinned explicitly and a memory-mapped read, which avoids one
+    userspace copy of the file. Callers can pass a dtype mapping to
+    skip inference for columns whose type they know, disable the NaN
+    scan entirely for files where they do their own handling, or pass
+    usecols to skip tokenizing columns they never read (a callable
+    keeps missing columns from raising, so the parsers' own
+    column-presence checks still fire).
+
+    With HERTTA_CSV_ENGINE=arrow the pyarrow reader is tried first,
+    falling back to the C engine when pyarrow is unavailable.
+    """
+    if _CSV_ENGINE == "arrow":
+        try:
+            return pd.read_csv(path, engine="pyarrow", dtype=dtype, usecols=usecols)
+        except (ImportError, ValueError):
+            pass
+    return pd.read_csv(
+        path,
+        engine="c",
+        memory_map=True,
+        dtype=dtype,
+        na_filter=na_filter,
+        usecols=usecols,
+    )
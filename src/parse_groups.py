@@ -3,7 +3,11 @@ from typing import Dict, Any, List
 
 import pandas as pd
 
+from parse_cache import cached_parse
+from parse_common import read_csv
 
+
+@cached_parse
 def parse_groups_csv(groups_csv_path: str) -> Dict[str, Any]:
     """
     Parse groups.csv.
@@ -42,8 +46,13 @@ def parse_groups_csv(groups_csv_path: str) -> Dict[str, Any]:
         print(f"No groups.csv found at {groups_csv_path} → skipping groups.")
         return empty_result
 
+    # cheap stat beats raising EmptyDataError out of the parser
+    if os.path.getsize(groups_csv_path) == 0:
+        print(f"groups.csv at {groups_csv_path} is empty → skipping groups.")
+        return empty_result
+
     try:
-        df = pd.read_csv(groups_csv_path)
+        df = read_csv(groups_csv_path)
     except pd.errors.EmptyDataError:
         print(f"groups.csv at {groups_csv_path} is empty → skipping groups.")
         return empty_result
@@ -62,31 +71,31 @@ def parse_groups_csv(groups_csv_path: str) -> Dict[str, Any]:
             )
             return empty_result
 
-    node_groups = set()
-    process_groups = set()
-    node_memberships: List[Dict[str, str]] = []
-    process_memberships: List[Dict[str, str]] = []
+    # whole-column strip/lower in pandas' C kernels, then boolean masks
+    # split the rows by group type without a Python-level row loop
+    group_type = df["group_type"].astype(str).str.strip().str.lower()
+    entity = df["entity"].astype(str).str.strip()
+    group = df["group"].astype(str).str.strip()
 
-    for _, row in df.iterrows():
-        group_type = str(row["group_type"]).strip().lower()
-        entity = str(row["entity"]).strip()
-        group = str(row["group"]).strip()
+    keep = entity.notna() & (entity != "") & group.notna() & (group != "")
+    node_mask = keep & (group_type == "node")
+    process_mask = keep & (group_type == "process")
 
-        if not entity or not group:
-            continue
+    for bad in group_type[keep & ~node_mask & ~process_mask].unique():
+        print(f"Warning: unknown group_type '{bad}' in groups.csv, row skipped.")
 
-        if group_type == "node":
-            node_groups.add(group)
-            node_memberships.append({"nodeName": entity, "groupName": group})
-        elif group_type == "process":
-            process_groups.add(group)
-            process_memberships.append({"processName": entity, "groupName": group})
-        else:
-            print(f"Warning: unknown group_type '{group_type}' in groups.csv, row skipped.")
+    node_memberships: List[Dict[str, str]] = [
+        {"nodeName": e, "groupName": g}
+        for e, g in zip(entity[node_mask], group[node_mask])
+    ]
+    process_memberships: List[Dict[str, str]] = [
+        {"processName": e, "groupName": g}
+        for e, g in zip(entity[process_mask], group[process_mask])
+    ]
 
     return {
-        "node_groups": sorted(node_groups),
-        "process_groups": sorted(process_groups),
+        "node_groups": sorted(group[node_mask].unique()),
+        "process_groups": sorted(group[process_mask].unique()),
         "node_memberships": node_memberships,
         "process_memberships": process_memberships,
     }
@@ -3,83 +3,50 @@ from typing import List, Dict, Any
 
 import pandas as pd
 
+from parse_cache import cached_parse
+from parse_common import read_csv
 
-def _to_bool(raw) -> bool:
-    if raw is None:
-        return False
-    if isinstance(raw, str):
-        v = raw.strip().lower()
-        if v in ("1", "true", "yes", "y", "t"):
-            return True
-        if v in ("0", "false", "no", "n", "f", ""):
-            return False
-    try:
-        return bool(int(raw))
-    except (ValueError, TypeError):
-        return bool(raw)
-
-
-def _to_float(raw, default: float = 0.0) -> float:
-    if raw is None:
-        return default
-    if isinstance(raw, str):
-        s = raw.strip()
-        if not s:
-            return default
-        s = s.replace(",", ".")
-        try:
-            return float(s)
-        except ValueError:
-            return default
-    try:
-        return float(raw)
-    except (ValueError, TypeError):
-        return default
-
-
-def _map_market_type(raw) -> str:
-    """
-    Map sheet 'market_type' to GraphQL MarketType enum.
-      ENERGY or RESERVE
-    """
-    if raw is None:
-        return "ENERGY"
-    s = str(raw).strip().lower()
-    if s in ("energy", "e"):
-        return "ENERGY"
-    if s in ("reserve", "res", "r"):
-        return "RESERVE"
-    # fallback
-    print(f"Warning: unknown market_type '{raw}', defaulting to ENERGY")
-    return "ENERGY"
-
-
-def _map_direction(raw) -> str | None:
+
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "y", "t"})
+
+# sheet 'market_type' → GraphQL MarketType enum
+_MARKET_TYPE_MAP = {
+    "energy": "ENERGY", "e": "ENERGY",
+    "reserve": "RESERVE", "res": "RESERVE", "r": "RESERVE",
+}
+
+# sheet 'direction' → MarketDirection enum (empty → None)
+_DIRECTION_MAP = {
+    "up": "UP", "u": "UP",
+    "down": "DOWN", "d": "DOWN",
+    "up_down": "UP_DOWN", "updown": "UP_DOWN", "both": "UP_DOWN",
+    "res_up": "RES_UP", "rup": "RES_UP", "reserve_up": "RES_UP",
+    "res_down": "RES_DOWN", "rdown": "RES_DOWN", "reserve_down": "RES_DOWN",
+}
+
+
+def _bool_series(s: pd.Series) -> pd.Series:
+    """Vectorized bool conversion: numeric columns test non-zero,
+    everything else matches the truthy string aliases."""
+    if s.dtype.kind in "ifb":
+        return s.fillna(0).astype(bool)
+    return s.astype(str).str.strip().str.lower().isin(_TRUE_STRINGS)
+
+
+def _float_series(s: pd.Series, default: float) -> pd.Series:
     """
-    Map sheet 'direction' to MarketDirection enum.
-      UP, DOWN, UP_DOWN, RES_UP, RES_DOWN
-    Empty -> None
+    Vectorized float conversion with a default for blank/bad cells.
+    Handles both dot and comma decimals.
     """
-    if raw is None:
-        return None
-    s = str(raw).strip().lower()
-    if not s:
-        return None
-    if s in ("up", "u"):
-        return "UP"
-    if s in ("down", "d"):
-        return "DOWN"
-    if s in ("up_down", "updown", "both"):
-        return "UP_DOWN"
-    if s in ("res_up", "rup", "reserve_up"):
-        return "RES_UP"
-    if s in ("res_down", "rdown", "reserve_down"):
-        return "RES_DOWN"
-
-    print(f"Warning: unknown direction '{raw}', leaving as None")
-    return None
+    if s.dtype.kind in "ifb":
+        return s.fillna(default).astype("float64")
+    return pd.to_numeric(
+        s.astype(str).str.strip().str.replace(",", ".", regex=False),
+        errors="coerce",
+    ).fillna(default)
 
 
+@cached_parse
 def parse_markets_csv_to_newmarkets(markets_csv_path: str) -> List[Dict[str, Any]]:
     """
     Read markets.csv and build a list of NewMarket inputs.
@@ -112,7 +79,7 @@ def parse_markets_csv_to_newmarkets(markets_csv_path: str) -> List[Dict[str, Any
         print(f"markets.csv not found at {markets_csv_path} → skipping markets.")
         return []
 
-    df = pd.read_csv(markets_csv_path)
+    df = read_csv(markets_csv_path)
 
     if df.empty:
         print(f"markets.csv at {markets_csv_path} has no data rows → skipping markets.")
@@ -139,44 +106,63 @@ def parse_markets_csv_to_newmarkets(markets_csv_path: str) -> List[Dict[str, Any
                 f"Available columns: {list(df.columns)}"
             )
 
-    markets: List[Dict[str, Any]] = []
-
-    for _, row in df.iterrows():
-        name = str(row["market"]).strip()
-        if not name:
-            continue
-
-        # realisation: if cell has a number, treat as scenario-independent constant
-        real_raw = row.get("realisation")
-        realisation: list[dict] = []
-        if pd.notna(real_raw) and str(real_raw).strip() != "":
-            realisation = [
-                {
-                    "scenario": None,
-                    "constant": _to_float(real_raw, 0.0),
-                }
-            ]
-
-        market_input: Dict[str, Any] = {
-            "name": name,
-            "mType": _map_market_type(row.get("market_type")),
-            "node": str(row.get("market_node" if "market_node" in df.columns else "node")).strip(),
-            "processGroup": str(row.get("processgroup")).strip(),
-            "direction": _map_direction(row.get("direction")),
-            "realisation": realisation,
-            "reserveType": None if pd.isna(row.get("reserve_type")) else str(row.get("reserve_type")).strip(),
-            "isBid": _to_bool(row.get("is_bid")),
-            "isLimited": _to_bool(row.get("is_limited")),
-            "minBid": _to_float(row.get("min_bid"), 0.0),
-            "maxBid": _to_float(row.get("max_bid"), 0.0),
-            "fee": _to_float(row.get("fee"), 0.0),
-            # time-series fields (to be filled from price sheets later)
-            "price": [],
-            "upPrice": [],
-            "downPrice": [],
-            "reserveActivationPrice": [],
-        }
-
-        markets.append(market_input)
+    # whole-column transforms in pandas' C kernels; Python only builds
+    # the final record dicts
+    names = df["market"].astype(str).str.strip()
+    keep = names.notna() & (names != "")
+
+    mtype = df["market_type"].astype(str).str.strip().str.lower().map(_MARKET_TYPE_MAP)
+    for bad in df["market_type"][mtype.isna() & keep].unique():
+        print(f"Warning: unknown market_type '{bad}', defaulting to ENERGY")
+    mtype = mtype.fillna("ENERGY")
+
+    dir_lower = df["direction"].astype(str).str.strip().str.lower()
+    direction = dir_lower.map(_DIRECTION_MAP)
+    # blank cells (NaN survives astype(str) on pandas 3) stay None silently
+    unknown_dir = (
+        direction.isna() & dir_lower.notna() & ~dir_lower.isin(("", "nan")) & keep
+    )
+    for bad in df["direction"][unknown_dir].unique():
+        print(f"Warning: unknown direction '{bad}', leaving as None")
+    direction = direction.astype(object).where(direction.notna(), None)
+
+    # realisation: a numeric cell becomes a scenario-independent constant
+    realisation = pd.to_numeric(
+        df["realisation"].astype(str).str.strip().str.replace(",", ".", regex=False),
+        errors="coerce",
+    )
+
+    reserve_type = (
+        df["reserve_type"].astype(str).str.strip()
+        .astype(object)
+        .where(df["reserve_type"].notna(), None)
+    )
+
+    node_col = "market_node" if "market_node" in df.columns else "node"
+
+    out = pd.DataFrame({
+        "name": names,
+        "mType": mtype,
+        "node": df[node_col].astype(str).str.strip(),
+        "processGroup": df["processgroup"].astype(str).str.strip(),
+        "direction": direction,
+        "reserveType": reserve_type,
+        "isBid": _bool_series(df["is_bid"]),
+        "isLimited": _bool_series(df["is_limited"]),
+        "minBid": _float_series(df["min_bid"], 0.0),
+        "maxBid": _float_series(df["max_bid"], 0.0),
+        "fee": _float_series(df["fee"], 0.0),
+    })[keep]
+
+    markets = out.to_dict(orient="records")
+    for market, real in zip(markets, realisation[keep]):
+        market["realisation"] = (
+            [] if pd.isna(real) else [{"scenario": None, "constant": float(real)}]
+        )
+        # time-series fields (to be filled from price sheets later)
+        market["price"] = []
+        market["upPrice"] = []
+        market["downPrice"] = []
+        market["reserveActivationPrice"] = []
 
     return markets
@@ -1,33 +1,40 @@
 import os
 import pandas as pd
-from typing import List, Dict, Any
-
-
-def _to_bool(raw) -> bool:
-    """Convert 0/1, true/false, yes/no, etc. to bool."""
-    if raw is None:
-        return False
-    if isinstance(raw, str):
-        v = raw.strip().lower()
-        if v in ("1", "true", "yes", "y", "t"):
-            return True
-        if v in ("0", "false", "no", "n", "f", ""):
-            return False
-    try:
-        return bool(int(raw))
-    except (ValueError, TypeError):
-        return bool(raw)
-
-
-def _to_float(raw, default: float = 0.0) -> float:
-    if raw is None:
-        return default
-    if isinstance(raw, str) and raw.strip() == "":
-        return default
-    try:
-        return float(raw)
-    except (ValueError, TypeError):
-        return default
+from typing import List, Dict, Any, Tuple
+
+from parse_cache import cached_parse
+from parse_common import read_csv
+
+# Explicit public surface; a duplicate/shadowing definition of one of
+# these would now fail loudly in import audits instead of silently
+# winning by position.
+__all__ = [
+    "parse_nodes_csv_to_newnodes",
+    "parse_node_states_from_nodes_csv",
+    "parse_nodes_and_states",
+]
+
+
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "y", "t"})
+
+
+def _bool_series(s: pd.Series, default: bool = False) -> pd.Series:
+    """Vectorized bool conversion: numeric columns test non-zero,
+    everything else matches the truthy string aliases. Blank cells take
+    `default`, so fields like isScenarioIndependent keep their True
+    default instead of silently flipping to False."""
+    if s.dtype.kind in "ifb":
+        return s.fillna(default).astype(bool)
+    text = s.astype(str).str.strip().str.lower()
+    blank = s.isna() | (text == "")
+    return text.isin(_TRUE_STRINGS).mask(blank, default)
+
+
+def _float_series(s: pd.Series, default: float) -> pd.Series:
+    """Vectorized float conversion with a default for blank/bad cells."""
+    if s.dtype.kind in "ifb":
+        return s.fillna(default).astype("float64")
+    return pd.to_numeric(s.astype(str).str.strip(), errors="coerce").fillna(default)
 
 
 # ------------ NODES: NewNode input ------------
@@ -49,8 +56,12 @@ def parse_nodes_csv_to_newnodes(nodes_csv_path: str) -> List[Dict[str, Any]]:
     if not os.path.isfile(nodes_csv_path):
         raise FileNotFoundError(f"nodes.csv not found at {nodes_csv_path}")
 
-    df = pd.read_csv(nodes_csv_path)
+    df = read_csv(nodes_csv_path)
+    return _newnodes_from_df(df)
+
 
+def _newnodes_from_df(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Build NewNode inputs from an already-loaded nodes.csv DataFrame."""
     required_cols = ["node", "is_commodity", "is_res", "is_market"]
     for col in required_cols:
         if col not in df.columns:
@@ -59,30 +70,58 @@ def parse_nodes_csv_to_newnodes(nodes_csv_path: str) -> List[Dict[str, Any]]:
                 f"Available columns: {list(df.columns)}"
             )
 
-    nodes: List[Dict[str, Any]] = []
+    # whole-column transforms in pandas' C kernels; Python only builds
+    # the final record dicts
+    names = df["node"].astype(str).str.strip()
+    keep = names.notna() & (names != "")  # skip empty/blank rows
 
-    for _, row in df.iterrows():
-        name = str(row["node"]).strip()
-        if not name:
-            continue  # skip empty rows
+    out = pd.DataFrame({
+        "name": names,
+        "isCommodity": _bool_series(df["is_commodity"]),
+        "isMarket": _bool_series(df["is_market"]),
+        "isRes": _bool_series(df["is_res"]),
+    })[keep]
 
-        node_input = {
-            "name": name,
-            "isCommodity": _to_bool(row.get("is_commodity")),
-            "isMarket": _to_bool(row.get("is_market")),
-            "isRes": _to_bool(row.get("is_res")),
-            # cost & inflow will be filled later from other sheets
-            "cost": [],
-            "inflow": [],
-        }
-
-        nodes.append(node_input)
+    nodes = out.to_dict(orient="records")
+    for node in nodes:
+        # cost & inflow will be filled later from other sheets
+        node["cost"] = []
+        node["inflow"] = []
 
     return nodes
 
 
 # ------------ NODE STATE: NewState input ------------
 
+_STATE_COL_MAP = {
+    "in_max": "inMax",
+    "out_max": "outMax",
+    "state_loss_proportional": "stateLossProportional",
+    "state_min": "stateMin",
+    "state_max": "stateMax",
+    "initial_state": "initialState",
+    "scenario_independent_state": "isScenarioIndependent",
+    "is_temp": "isTemp",
+    "t_e_conversion": "tEConversion",
+    "residual_value": "residualValue",
+}
+
+_STATE_BOOL_FIELDS = ("isScenarioIndependent", "isTemp")
+
+_STATE_DEFAULTS: Dict[str, Any] = {
+    "inMax": 0.0,
+    "outMax": 0.0,
+    "stateLossProportional": 0.0,
+    "stateMin": 0.0,
+    "stateMax": 0.0,
+    "initialState": 0.0,
+    "isScenarioIndependent": True,
+    "isTemp": False,
+    "tEConversion": 1.0,
+    "residualValue": 0.0,
+}
+
+
 def parse_node_states_from_nodes_csv(nodes_csv_path: str) -> List[Dict[str, Any]]:
     """
     Read nodes.csv and build a list of objects of the form
@@ -97,58 +136,57 @@ def parse_node_states_from_nodes_csv(nodes_csv_path: str) -> List[Dict[str, Any]
     if not os.path.isfile(nodes_csv_path):
         raise FileNotFoundError(f"nodes.csv not found at {nodes_csv_path}")
 
-    df = pd.read_csv(nodes_csv_path)
+    df = read_csv(nodes_csv_path)
+    return _node_states_from_df(df)
+
 
+def _node_states_from_df(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Build node state entries from an already-loaded nodes.csv DataFrame."""
     if "node" not in df.columns:
         raise ValueError("nodes.csv must have a 'node' column for node names.")
 
-    state_col_map = {
-        "in_max": "inMax",
-        "out_max": "outMax",
-        "state_loss_proportional": "stateLossProportional",
-        "state_min": "stateMin",
-        "state_max": "stateMax",
-        "initial_state": "initialState",
-        "scenario_independent_state": "isScenarioIndependent",
-        "is_temp": "isTemp",
-        "t_e_conversion": "tEConversion",
-        "residual_value": "residualValue",
-    }
-
-    node_states: List[Dict[str, Any]] = []
+    names = df["node"].astype(str).str.strip()
+    keep = names.notna() & (names != "")
 
-    for _, row in df.iterrows():
-        name = str(row["node"]).strip()
-        if not name:
-            continue
+    # only create a state if is_state is true
+    if "is_state" in df.columns:
+        keep &= _bool_series(df["is_state"])
 
-        # only create a state if is_state is true
-        if "is_state" in df.columns and not _to_bool(row.get("is_state")):
+    # convert each present state column in one vectorized pass
+    state_df = pd.DataFrame(index=df.index)
+    for col_name, field_name in _STATE_COL_MAP.items():
+        if col_name not in df.columns:
             continue
+        if field_name in _STATE_BOOL_FIELDS:
+            state_df[field_name] = _bool_series(
+                df[col_name], _STATE_DEFAULTS[field_name]
+            )
+        else:
+            state_df[field_name] = _float_series(
+                df[col_name], _STATE_DEFAULTS[field_name]
+            )
 
-        # defaults
-        state: Dict[str, Any] = {
-            "inMax": 0.0,
-            "outMax": 0.0,
-            "stateLossProportional": 0.0,
-            "stateMin": 0.0,
-            "stateMax": 0.0,
-            "initialState": 0.0,
-            "isScenarioIndependent": True,
-            "isTemp": False,
-            "tEConversion": 1.0,
-            "residualValue": 0.0,
-        }
-
-        for col_name, field_name in state_col_map.items():
-            if col_name not in df.columns:
-                continue
-            raw = row.get(col_name)
-            if field_name in ("isScenarioIndependent", "isTemp"):
-                state[field_name] = _to_bool(raw)
-            else:
-                state[field_name] = _to_float(raw, default=state[field_name])
-
+    node_states: List[Dict[str, Any]] = []
+    for name, record in zip(names[keep], state_df[keep].to_dict(orient="records")):
+        state = dict(_STATE_DEFAULTS)
+        state.update(record)
         node_states.append({"nodeName": name, "state": state})
 
     return node_states
+
+
+# ------------ Combined single-read entry point ------------
+
+@cached_parse
+def parse_nodes_and_states(
+    nodes_csv_path: str,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Read nodes.csv once and build both the NewNode inputs and the node
+    states, instead of parsing the same file twice.
+    """
+    if not os.path.isfile(nodes_csv_path):
+        raise FileNotFoundError(f"nodes.csv not found at {nodes_csv_path}")
+
+    df = read_csv(nodes_csv_path)
+    return _newnodes_from_df(df), _node_states_from_df(df)
@@ -2,61 +2,36 @@ import os
 import pandas as pd
 from typing import List, Dict, Any
 
+from parse_cache import cached_parse
+from parse_common import read_csv
 
-def _to_bool(raw) -> bool:
-    """Convert 0/1, true/false, yes/no, etc. to bool."""
-    if raw is None:
-        return False
-    if isinstance(raw, str):
-        v = raw.strip().lower()
-        if v in ("1", "true", "yes", "y", "t"):
-            return True
-        if v in ("0", "false", "no", "n", "f", ""):
-            return False
-    try:
-        return bool(int(raw))
-    except (ValueError, TypeError):
-        return bool(raw)
-
-
-def _to_float(raw, default: float = 0.0) -> float:
-    if raw is None:
-        return default
-    if isinstance(raw, str) and raw.strip() == "":
-        return default
-    try:
-        return float(raw)
-    except (ValueError, TypeError):
-        return default
-
-
-def _map_conversion(raw) -> str:
-    """
-    Map processes.csv 'conversion' column to GraphQL enum Conversion.
 
-    Spreadsheet codes:
-      1 -> UNIT
-      2 -> TRANSFER
-      3 -> MARKET
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "y", "t"})
+
+# processes.csv 'conversion' codes → GraphQL enum Conversion
+_CONVERSION_MAP = {
+    "1": "UNIT", "unit": "UNIT", "u": "UNIT",
+    "2": "TRANSFER", "transfer": "TRANSFER", "t": "TRANSFER",
+    "3": "MARKET", "market": "MARKET", "m": "MARKET",
+}
 
-    Also accepts strings: "Unit", "Transfer", "Market".
-    """
-    if raw is None:
-        return "UNIT"
 
-    s = str(raw).strip().lower()
+def _bool_series(s: pd.Series) -> pd.Series:
+    """Vectorized bool conversion: numeric columns test non-zero,
+    everything else matches the truthy string aliases."""
+    if s.dtype.kind in "ifb":
+        return s.fillna(0).astype(bool)
+    return s.astype(str).str.strip().str.lower().isin(_TRUE_STRINGS)
 
-    if s in ("1", "unit", "u"):
-        return "UNIT"
-    if s in ("2", "transfer", "t"):
-        return "TRANSFER"
-    if s in ("3", "market", "m"):
-        return "MARKET"
 
-    raise ValueError(f"Unsupported conversion value {raw!r} in processes.csv; "
-                     "expected 1/2/3 or Unit/Transfer/Market")
+def _float_series(s: pd.Series, default: float) -> pd.Series:
+    """Vectorized float conversion with a default for blank/bad cells."""
+    if s.dtype.kind in "ifb":
+        return s.fillna(default).astype("float64")
+    return pd.to_numeric(s.astype(str).str.strip(), errors="coerce").fillna(default)
 
 
+@cached_parse
 def parse_processes_csv_to_newprocesses(processes_csv_path: str) -> List[Dict[str, Any]]:
     """
     Read processes.csv and build a list of NewProcess inputs.
@@ -70,7 +45,7 @@ def parse_processes_csv_to_newprocesses(processes_csv_path: str) -> List[Dict[st
     if not os.path.isfile(processes_csv_path):
         raise FileNotFoundError(f"processes.csv not found at {processes_csv_path}")
 
-    df = pd.read_csv(processes_csv_path)
+    df = read_csv(processes_csv_path)
 
     required_cols = [
         "process",
@@ -96,37 +71,44 @@ def parse_processes_csv_to_newprocesses(processes_csv_path: str) -> List[Dict[st
                 f"Available columns: {list(df.columns)}"
             )
 
-    processes: List[Dict[str, Any]] = []
-
-    for _, row in df.iterrows():
-        name = str(row["process"]).strip()
-        if not name:
-            continue
-
-        conversion = _map_conversion(row.get("conversion"))
-
-        proc: Dict[str, Any] = {
-            "name": name,
-            "conversion": conversion,
-            "isCfFix": _to_bool(row.get("is_cf_fix")),
-            "isOnline": _to_bool(row.get("is_online")),
-            "isRes": _to_bool(row.get("is_res")),
-            "eff": _to_float(row.get("eff"), 1.0),
-            "loadMin": _to_float(row.get("load_min"), 0.0),
-            "loadMax": _to_float(row.get("load_max"), 1.0),
-            "startCost": _to_float(row.get("start_cost"), 0.0),
-            "minOnline": _to_float(row.get("min_online"), 0.0),
-            "maxOnline": _to_float(row.get("max_online"), 0.0),
-            "minOffline": _to_float(row.get("min_offline"), 0.0),
-            "maxOffline": _to_float(row.get("max_offline"), 0.0),
-            "initialState": _to_bool(row.get("initial_state")),
-            "isScenarioIndependent": _to_bool(row.get("scenario_independent_online")),
-            # time-series fields – to be filled from ts sheets later
-            "cf": [],
-            "effTs": [],
-            "effOpsFun": [],
-        }
-
-        processes.append(proc)
+    # whole-column transforms in pandas' C kernels; Python only builds
+    # the final record dicts
+    names = df["process"].astype(str).str.strip()
+    keep = names.notna() & (names != "")
+
+    conversion = (
+        df["conversion"].astype(str).str.strip().str.lower().map(_CONVERSION_MAP)
+    )
+    bad = conversion.isna() & keep
+    if bad.any():
+        raise ValueError(
+            f"Unsupported conversion value {df['conversion'][bad].iloc[0]!r} "
+            "in processes.csv; expected 1/2/3 or Unit/Transfer/Market"
+        )
+
+    out = pd.DataFrame({
+        "name": names,
+        "conversion": conversion,
+        "isCfFix": _bool_series(df["is_cf_fix"]),
+        "isOnline": _bool_series(df["is_online"]),
+        "isRes": _bool_series(df["is_res"]),
+        "eff": _float_series(df["eff"], 1.0),
+        "loadMin": _float_series(df["load_min"], 0.0),
+        "loadMax": _float_series(df["load_max"], 1.0),
+        "startCost": _float_series(df["start_cost"], 0.0),
+        "minOnline": _float_series(df["min_online"], 0.0),
+        "maxOnline": _float_series(df["max_online"], 0.0),
+        "minOffline": _float_series(df["min_offline"], 0.0),
+        "maxOffline": _float_series(df["max_offline"], 0.0),
+        "initialState": _bool_series(df["initial_state"]),
+        "isScenarioIndependent": _bool_series(df["scenario_independent_online"]),
+    })[keep]
+
+    processes = out.to_dict(orient="records")
+    for proc in processes:
+        # time-series fields – to be filled from ts sheets later
+        proc["cf"] = []
+        proc["effTs"] = []
+        proc["effOpsFun"] = []
 
     return processes
@@ -3,26 +3,15 @@ from typing import List, Dict, Any
 
 import pandas as pd
 
+from parse_cache import cached_parse
+from parse_common import read_csv
 
-def _to_float(raw, default: float = 0.0) -> float:
-    """Convert value to float, handling comma decimals."""
-    if raw is None:
-        return default
-    if isinstance(raw, str):
-        s = raw.strip()
-        if not s:
-            return default
-        s = s.replace(",", ".")  # allow 0,1 style
-        try:
-            return float(s)
-        except ValueError:
-            return default
-    try:
-        return float(raw)
-    except (ValueError, TypeError):
-        return default
+
+# only these columns are ever read; usecols skips tokenizing the rest
+_USED_COLS = frozenset({"parameter", "value"})
 
 
+@cached_parse
 def parse_risk_csv_to_newrisks(risk_csv_path: str) -> List[Dict[str, Any]]:
     """
     Parse risk.csv (parameter,value) -> list of NewRisk dicts.
@@ -36,8 +25,13 @@ def parse_risk_csv_to_newrisks(risk_csv_path: str) -> List[Dict[str, Any]]:
         print(f"risk.csv not found at {risk_csv_path} → skipping risk.")
         return []
 
+    # cheap stat beats raising EmptyDataError out of the parser
+    if os.path.getsize(risk_csv_path) == 0:
+        print(f"risk.csv at {risk_csv_path} is empty → skipping risk.")
+        return []
+
     try:
-        df = pd.read_csv(risk_csv_path)
+        df = read_csv(risk_csv_path, usecols=_USED_COLS.__contains__)
     except pd.errors.EmptyDataError:
         print(f"risk.csv at {risk_csv_path} is empty → skipping risk.")
         return []
@@ -54,20 +48,14 @@ def parse_risk_csv_to_newrisks(risk_csv_path: str) -> List[Dict[str, Any]]:
             )
             return []
 
-    risks: List[Dict[str, Any]] = []
-
-    for _, row in df.iterrows():
-        param = str(row["parameter"]).strip()
-        if not param:
-            continue
-
-        value = _to_float(row.get("value"), 0.0)
-
-        risks.append(
-            {
-                "parameter": param,
-                "value": value,
-            }
-        )
-
-    return risks
+    # strip, comma-decimal repair and float cast all run as column ops;
+    # Python only packs the final dicts
+    params = df["parameter"].astype(str).str.strip()
+    values = pd.to_numeric(
+        df["value"].astype(str).str.replace(",", ".", regex=False),
+        errors="coerce",
+    ).fillna(0.0)
+    keep = params.notna() & (params != "")
+
+    out = pd.DataFrame({"parameter": params, "value": values})[keep]
+    return out.to_dict(orient="records")
@@ -3,26 +3,16 @@ from typing import List, Dict, Any
 
 import pandas as pd
 
+from parse_cache import cached_parse
+from parse_common import read_csv
 
-def _to_float(raw, default: float = 0.0) -> float:
-    """Convert value to float, handling comma decimals."""
-    if raw is None:
-        return default
-    if isinstance(raw, str):
-        s = raw.strip()
-        if not s:
-            return default
-        s = s.replace(",", ".") 
-        try:
-            return float(s)
-        except ValueError:
-            return default
-    try:
-        return float(raw)
-    except (ValueError, TypeError):
-        return default
+
+# only these columns are ever read (both probability spellings);
+# usecols skips tokenizing the rest
+_USED_COLS = frozenset({"name", "probability", "propability"})
 
 
+@cached_parse
 def parse_scenarios_csv_to_list(scen_csv_path: str) -> List[Dict[str, Any]]:
     """
     Parse scenarios.csv -> list of {name, weight} dicts.
@@ -36,8 +26,13 @@ def parse_scenarios_csv_to_list(scen_csv_path: str) -> List[Dict[str, Any]]:
         print(f"scenarios csv not found at {scen_csv_path} → skipping scenarios.")
         return []
 
+    # cheap stat beats raising EmptyDataError out of the parser
+    if os.path.getsize(scen_csv_path) == 0:
+        print(f"scenarios csv at {scen_csv_path} is empty → skipping scenarios.")
+        return []
+
     try:
-        df = pd.read_csv(scen_csv_path)
+        df = read_csv(scen_csv_path, usecols=_USED_COLS.__contains__)
     except pd.errors.EmptyDataError:
         print(f"scenarios csv at {scen_csv_path} is empty → skipping scenarios.")
         return []
@@ -60,20 +55,13 @@ def parse_scenarios_csv_to_list(scen_csv_path: str) -> List[Dict[str, Any]]:
         )
         return []
 
-    scenarios: List[Dict[str, Any]] = []
-
-    for _, row in df.iterrows():
-        name = str(row["name"]).strip()
-        if not name:
-            continue
-
-        prob = _to_float(row.get(prob_col), 0.0)
-
-        scenarios.append(
-            {
-                "name": name,
-                "weight": prob,
-            }
-        )
+    # column-wide strip and numeric coercion; the loop below is gone
+    names = df["name"].astype(str).str.strip()
+    probs = pd.to_numeric(
+        df[prob_col].astype(str).str.replace(",", ".", regex=False),
+        errors="coerce",
+    ).fillna(0.0)
+    keep = names.notna() & (names != "")
 
-    return scenarios
+    out = pd.DataFrame({"name": names, "weight": probs})[keep]
+    return out.to_dict(orient="records")
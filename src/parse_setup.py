@@ -1,57 +1,71 @@
 import pandas as pd
 import os
+from types import MappingProxyType
 
+from parse_cache import cached_parse
+from parse_common import read_csv
 
+
+# lookup tables built once at import, not per call; the field map is a
+# read-only view so no caller can mutate it between runs
+_FIELD_MAP = MappingProxyType({
+    "use_market_bids": "useMarketBids",
+    "use_reserves": "useReserves",
+    "use_reserve_realisation": "useReserveRealisation",
+    "use_node_dummy_variables": "useNodeDummyVariables",
+    "use_ramp_dummy_variables": "useRampDummyVariables",
+    "common_start_timesteps": "commonTimesteps",
+    "common_scenario_name": "commonScenarioName",
+    "node_dummy_variable_cost": "nodeDummyVariableCost",
+    "ramp_dummy_variable_cost": "rampDummyVariableCost",
+})
+
+_BOOL_PARAMS = frozenset({
+    "use_market_bids",
+    "use_reserves",
+    "use_reserve_realisation",
+    "use_node_dummy_variables",
+    "use_ramp_dummy_variables",
+})
+
+_INT_PARAMS = frozenset({"common_start_timesteps"})
+
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "y", "t"})
+
+# only these columns are ever read; usecols skips tokenizing the rest
+_USED_COLS = frozenset({"parameter", "value"})
+
+
+@cached_parse
 def parse_setup_csv_to_inputdatasetup(setup_csv_path: str) -> dict:
-    df = pd.read_csv(setup_csv_path)
-
-    field_map = {
-        "use_market_bids": "useMarketBids",
-        "use_reserves": "useReserves",
-        "use_reserve_realisation": "useReserveRealisation",
-        "use_node_dummy_variables": "useNodeDummyVariables",
-        "use_ramp_dummy_variables": "useRampDummyVariables",
-        "common_start_timesteps": "commonTimesteps",
-        "common_scenario_name": "commonScenarioName",
-        "node_dummy_variable_cost": "nodeDummyVariableCost",
-        "ramp_dummy_variable_cost": "rampDummyVariableCost",
-    }
-
-    bool_params = {
-        "use_market_bids",
-        "use_reserves",
-        "use_reserve_realisation",
-        "use_node_dummy_variables",
-        "use_ramp_dummy_variables",
-    }
-
-    int_params = {"common_start_timesteps"}
+    df = read_csv(setup_csv_path, usecols=_USED_COLS.__contains__)
+
+    # one pass over the CSV builds a parameter→value lookup; the
+    # driving loop is then over the fixed field map, not the rows
+    lut = dict(zip(df["parameter"].astype(str).str.strip(), df["value"]))
 
     setup_input = {}
 
-    for _, row in df.iterrows():
-        param = str(row["parameter"]).strip()
-        if param not in field_map:
+    for param, gql_field in _FIELD_MAP.items():
+        if param not in lut:
             continue
 
-        raw_value = row["value"]
-        gql_field = field_map[param]
+        raw_value = lut[param]
 
         if pd.isna(raw_value):
             value = None
-        else:
-            if param in bool_params:
-                if isinstance(raw_value, str):
-                    v = raw_value.strip().lower()
-                    value = v in ("1", "true", "yes")
-                else:
-                    value = bool(int(raw_value))
-            elif param in int_params:
-                value = int(raw_value)
-            elif param == "common_scenario_name":
-                value = str(raw_value)
+        elif param in _BOOL_PARAMS:
+            if isinstance(raw_value, str):
+                value = raw_value.strip().lower() in _TRUE_STRINGS
             else:
-                value = float(raw_value)
+                value = bool(int(raw_value))
+        elif param in _INT_PARAMS:
+            # int(float(...)) tolerates accidental "3.0" style cells
+            value = int(float(raw_value))
+        elif param == "common_scenario_name":
+            value = str(raw_value)
+        else:
+            value = float(raw_value)
 
         setup_input[gql_field] = value
 
@@ -3,42 +3,51 @@ from typing import List, Dict, Any
 
 import pandas as pd
 
-
-def _to_float(raw, default: float = 0.0) -> float:
-    if raw is None:
-        return default
-    if isinstance(raw, str) and raw.strip() == "":
-        return default
-    try:
-        return float(raw)
-    except (ValueError, TypeError):
-        return default
-
-
-def _split_source_sink(role_raw: str, node_name: str):
-    """
-    Decide whether the node is source or sink.
-
-    source_sink column is expected to be like: "source" / "sink"
-    (but we accept a few variants).
-    """
-    if not node_name:
-        return None, None
-
-    if not role_raw:
-        return None, None
-
-    r = role_raw.strip().lower()
-
-    if r in ("source", "src", "s", "in", "input"):
-        return node_name, None
-    if r in ("sink", "snk", "d", "out", "output"):
-        return None, node_name
-
-    print(f"Warning: unknown source_sink value '{role_raw}' – row skipped.")
-    return None, None
-
-
+from parse_cache import cached_parse
+from parse_common import read_csv
+
+
+# only these columns are ever read; usecols skips tokenizing the rest
+# (conversion_coeff in particular is explicitly ignored)
+_USED_COLS = frozenset({
+    "process",
+    "source_sink",
+    "node",
+    "capacity",
+    "vom_cost",
+    "ramp_up",
+    "ramp_down",
+    "initial_load",
+    "initial_flow",
+})
+
+# CSV column → NewTopology field for the numeric inputs
+_NUM_FIELDS = (
+    ("capacity", "capacity"),
+    ("vom_cost", "vomCost"),
+    ("ramp_up", "rampUp"),
+    ("ramp_down", "rampDown"),
+    ("initial_load", "initialLoad"),
+    ("initial_flow", "initialFlow"),
+)
+
+# source_sink column is expected to be "source" / "sink", but we accept
+# a few variants; applied column-wide via Series.map
+_ROLE_MAP = {
+    "source": "source",
+    "src": "source",
+    "s": "source",
+    "in": "source",
+    "input": "source",
+    "sink": "sink",
+    "snk": "sink",
+    "d": "sink",
+    "out": "sink",
+    "output": "sink",
+}
+
+
+@cached_parse
 def parse_process_topologies_csv_to_inputs(
     topo_csv_path: str,
 ) -> List[Dict[str, Any]]:
@@ -72,8 +81,13 @@ def parse_process_topologies_csv_to_inputs(
         print(f"No topology csv found at {topo_csv_path} → skipping topologies.")
         return []
 
+    # cheap stat beats raising EmptyDataError out of the parser
+    if os.path.getsize(topo_csv_path) == 0:
+        print(f"Topology csv at {topo_csv_path} is empty → skipping topologies.")
+        return []
+
     try:
-        df = pd.read_csv(topo_csv_path)
+        df = read_csv(topo_csv_path, usecols=_USED_COLS.__contains__)
     except pd.errors.EmptyDataError:
         print(f"Topology csv at {topo_csv_path} is empty → skipping topologies.")
         return []
@@ -101,32 +115,49 @@ def parse_process_topologies_csv_to_inputs(
             )
             return []
 
-    topologies: List[Dict[str, Any]] = []
-
-    for _, row in df.iterrows():
-        process_name = str(row["process"]).strip()
-        node_name = str(row["node"]).strip()
+    # coerce all six numeric columns in one vectorized pass each; the
+    # row loop below only packs dicts
+    process = df["process"].astype(str).str.strip()
+    node = df["node"].astype(str).str.strip()
+    role_raw = df["source_sink"].astype(str).str.strip()
+    # NaN survives astype(str) under pandas 3, so blank rows need an
+    # explicit notna() guard like the other vectorized parsers
+    keep = process.notna() & (process != "") & node.notna() & (node != "")
+    # category dtype dedups the repeated role strings, so the map runs
+    # once per distinct value instead of once per row
+    roles = role_raw.str.lower().astype("category").map(_ROLE_MAP)
+    unknown = keep & roles.isna() & role_raw.notna() & (role_raw != "")
+    for bad in role_raw[unknown].unique():
+        print(f"Warning: unknown source_sink value '{bad}' – row skipped.")
+    keep_arr = keep.to_numpy()
+    nums = {
+        field: pd.to_numeric(
+            df[col].astype(str).str.replace(",", ".", regex=False),
+            errors="coerce",
+        ).fillna(0.0).to_numpy()[keep_arr]
+        for col, field in _NUM_FIELDS
+    }
 
-        if not process_name or not node_name:
-            continue
-
-        source_raw = str(row.get("source_sink", "")).strip()
-        source_name, sink_name = _split_source_sink(source_raw, node_name)
-        if source_name is None and sink_name is None:
-            # unknown source_sink -> row already warned, skip
+    topologies: List[Dict[str, Any]] = []
+    _append = topologies.append  # skip the attribute lookup per row
+
+    for i, (process_name, node_name, role) in enumerate(
+        zip(process[keep], node[keep], roles[keep])
+    ):
+        if role == "source":
+            source_name, sink_name = node_name, None
+        elif role == "sink":
+            source_name, sink_name = None, node_name
+        else:
+            # unknown source_sink -> already warned above, skip
             continue
 
         topo_input: Dict[str, Any] = {
-            "capacity": _to_float(row.get("capacity"), 0.0),
-            "vomCost": _to_float(row.get("vom_cost"), 0.0),
-            "rampUp": _to_float(row.get("ramp_up"), 0.0),
-            "rampDown": _to_float(row.get("ramp_down"), 0.0),
-            "initialLoad": _to_float(row.get("initial_load"), 0.0),
-            "initialFlow": _to_float(row.get("initial_flow"), 0.0),
-            "capTs": [],  # no time series yet
+            field: float(arr[i]) for field, arr in nums.items()
         }
+        topo_input["capTs"] = []  # no time series yet
 
-        topologies.append(
+        _append(
             {
                 "processName": process_name,
                 "sourceNodeName": source_name,
@@ -0,0 +1,167 @@
+import os
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from parse_common import read_csv
+
+
+def _to_float_array(series: pd.Series) -> np.ndarray:
+    """
+    Vectorized float conversion of a column (NaN for non-numeric cells).
+    Handles both dot and comma decimals (e.g. -42.77 or -42,77).
+    """
+    if series.dtype.kind in "if":
+        return series.to_numpy(dtype="float64")
+    return pd.to_numeric(
+        series.astype(str).str.replace(",", ".", regex=False),
+        errors="coerce",
+    ).to_numpy(dtype="float64")
+
+
+def _clean_and_classify(
+    series: pd.Series,
+) -> Tuple[Optional[np.ndarray], bool, float]:
+    """
+    Single kernel for the per-column hot path: convert to float64,
+    decide constant-vs-series from a NaN-ignoring min/max scan of the
+    raw array, and only materialize the NaN-filtered copy for genuine
+    series. Returns (values, is_constant, first_value); values is None
+    for constant columns (first_value carries the constant) and for
+    columns with no numeric cells (is_constant False).
+    """
+    # In scenario sweeps most columns repeat a single number (inactive
+    # scenarios are all 0.0). For text columns, a C-level string dedup
+    # is much cheaper than parsing every cell, so check that first and
+    # parse only the one distinct value.
+    if series.dtype.kind not in "if":
+        uniq = series.dropna().astype(str).str.strip().unique()
+        uniq = uniq[uniq != ""]
+        if uniq.size == 0:
+            return None, False, 0.0
+        if uniq.size == 1:
+            try:
+                return None, True, float(uniq[0].replace(",", "."))
+            except ValueError:
+                return None, False, 0.0
+    arr = _to_float_array(series)
+    mask = ~np.isnan(arr)
+    if not mask.any():
+        return None, False, 0.0
+    vmin = np.nanmin(arr)
+    if vmin == np.nanmax(arr):
+        # every numeric cell equals vmin — no need to copy the column
+        return None, True, float(vmin)
+    values = arr[mask]
+    return values, False, float(values[0])
+
+
+def _read_wide_table(csv_path: str, label: str) -> pd.DataFrame:
+    """
+    Load a wide time-series table. A `.parquet`/`.feather` path is read
+    directly as a binary columnar file (no text parsing, no decimal
+    repair needed — the columns already are float64). For a `.csv`
+    path, a sibling `.parquet` at least as fresh as the CSV is
+    preferred when pyarrow is available; excel_to_csv dual-emits those.
+    Falls back to the CSV reader in every other case.
+    """
+    suffix = os.path.splitext(csv_path)[1].lower()
+    if suffix in (".parquet", ".feather"):
+        reader = pd.read_parquet if suffix == ".parquet" else pd.read_feather
+        return reader(csv_path)
+
+    parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+    if os.path.isfile(parquet_path):
+        try:
+            if os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+                return pd.read_parquet(parquet_path)
+        except (ImportError, OSError, ValueError):
+            pass  # no parquet engine / unreadable file → fall back to CSV
+
+    return read_csv(csv_path)
+
+
+def parse_wide_scenario_csv(
+    csv_path: str,
+    label: str,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Shared parser for the wide time-series CSVs (cf, inflow, node price,
+    market prices). Builds a mapping:
+
+        { entityName: [ValueInput, ValueInput, ...], ... }
+
+    Expected CSV layout:
+
+        t, <entityName1>,<scenario1>, <entityName2>,<scenario2>, ...
+
+    For each non-'t' column:
+
+      * header is split by ',' → entityName, scenarioName
+      * if scenarioName == 'ALL' -> scenario is set to None
+      * column values:
+          - if all equal -> {scenario, constant: v}
+          - else         -> {scenario, series: [v1, v2, ...]}
+
+    If the file is missing or empty, returns {}. `label` names the
+    category in the skip messages.
+    """
+    if not os.path.isfile(csv_path):
+        print(f"No {label} csv found at {csv_path} → skipping {label}.")
+        return {}
+
+    # cheap stat beats raising EmptyDataError out of the parser
+    if os.path.getsize(csv_path) == 0:
+        print(f"{label} csv at {csv_path} is empty → skipping {label}.")
+        return {}
+
+    try:
+        df = _read_wide_table(csv_path, label)
+    except pd.errors.EmptyDataError:
+        print(f"{label} csv at {csv_path} is empty → skipping {label}.")
+        return {}
+
+    if df.empty or len(df.columns) <= 1:
+        print(f"{label} csv at {csv_path} has no data columns → skipping {label}.")
+        return {}
+
+    result: Dict[str, List[Dict[str, Any]]] = {}
+
+    # Assume first column is time 't'; all others are entity,scenario.
+    # Split every header in one vectorized pass instead of a Python
+    # str.split per column — with scenario sweeps there can be hundreds
+    # of columns and only a handful of rows.
+    headers = pd.Index(df.columns[1:]).astype(str).str.strip()
+    parts = headers.to_series(index=range(len(headers))).str.split(",", n=1, expand=True)
+    if parts.shape[1] == 1:
+        parts[1] = None
+    entities = parts[0].str.strip()
+    # 'ALL' (any case) and absent scenario both mean "all scenarios".
+    # Built as a Python list on purpose: Series.where would store the
+    # replacement as NaN under the str dtype, and the API promises None.
+    scenarios = [
+        None if pd.isna(s) or s.upper() == "ALL" else s
+        for s in parts[1].str.strip()
+    ]
+
+    for col, entity, scenario in zip(df.columns[1:], entities, scenarios):
+        if not entity:
+            continue
+
+        values, is_constant, first = _clean_and_classify(df[col])
+        if is_constant:
+            vi: Dict[str, Any] = {
+                "scenario": scenario,
+                "constant": first,
+            }
+        elif values is None:
+            continue  # no numeric cells in this column
+        else:
+            vi = {
+                "scenario": scenario,
+                "series": values.tolist(),
+            }
+
+        result.setdefault(entity, []).append(vi)
+
+    return result